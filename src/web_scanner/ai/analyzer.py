@@ -1,6 +1,7 @@
 """AI-powered content analyzer using OpenRouter."""
 
 import asyncio
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -8,38 +9,15 @@ from typing import Any
 import structlog
 
 from ..analyzers.base import BaseAnalyzer
-from ..models import CrawledPage, ExtractedData
+from ..models import AIIssue, CrawledPage, ExtractedData, TextCorrection
 from .client import OpenRouterClient
 
 logger = structlog.get_logger()
 
 
-@dataclass
-class AIIssue:
-    """Represents an issue found by AI analysis."""
-
-    severity: str  # critical, warning, info
-    category: str  # Grammar, HTML, Visual, etc.
-    description: str
-    location: str | None = None
-    suggestion: str | None = None
-    original: str | None = None
-    source_url: str | None = None
-    source_type: str | None = None  # text, html, screenshot
-    bbox: list[float] | None = None  # Normalized bounding box [x, y, w, h]
-    evidence: str | None = None  # OCR text or visual cue observed
-    confidence: int | None = None  # 1-5 confidence score
-
-
-@dataclass
-class TextCorrection:
-    """Represents a text correction found in screenshot analysis."""
-
-    original: str
-    correction: str
-    explanation: str
-    bbox: list[float] | None = None
-    confidence: int | None = None
+def _intern(value: Any) -> Any:
+    """Intern a low-cardinality string so every issue shares one object."""
+    return sys.intern(value) if isinstance(value, str) else value
 
 
 @dataclass
@@ -214,8 +192,8 @@ class AIAnalyzer(BaseAnalyzer):
             if "issues" in analysis:
                 for issue_data in analysis["issues"]:
                     issue = AIIssue(
-                        severity=issue_data.get("severity", "info"),
-                        category=issue_data.get("category", "Text"),
+                        severity=_intern(issue_data.get("severity", "info")),
+                        category=_intern(issue_data.get("category", "Text")),
                         description=issue_data.get("description", ""),
                         location=issue_data.get("location"),
                         suggestion=issue_data.get("suggestion"),
@@ -251,8 +229,8 @@ class AIAnalyzer(BaseAnalyzer):
             if "issues" in analysis:
                 for issue_data in analysis["issues"]:
                     issue = AIIssue(
-                        severity=issue_data.get("severity", "info"),
-                        category=issue_data.get("category", "HTML"),
+                        severity=_intern(issue_data.get("severity", "info")),
+                        category=_intern(issue_data.get("category", "HTML")),
                         description=issue_data.get("description", ""),
                         location=issue_data.get("location"),
                         suggestion=issue_data.get("suggestion"),
@@ -287,8 +265,8 @@ class AIAnalyzer(BaseAnalyzer):
             if "issues" in analysis:
                 for issue_data in analysis["issues"]:
                     issue = AIIssue(
-                        severity=issue_data.get("severity", "info"),
-                        category=issue_data.get("category", "Visual"),
+                        severity=_intern(issue_data.get("severity", "info")),
+                        category=_intern(issue_data.get("category", "Visual")),
                         description=issue_data.get("description", ""),
                         location=issue_data.get("location"),
                         suggestion=issue_data.get("suggestion"),
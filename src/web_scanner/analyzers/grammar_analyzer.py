@@ -19,14 +19,28 @@ class GrammarAnalyzer(BaseAnalyzer):
     def __init__(self):
         self._tool = None
         self._language = settings.grammar_language
+        self._start_lock = asyncio.Lock()
+        self._start_error: Exception | None = None
 
     async def start(self) -> None:
-        """Initialize LanguageTool."""
-        if self._tool is None:
-            # LanguageTool initialization is blocking, run in executor
-            loop = asyncio.get_event_loop()
-            self._tool = await loop.run_in_executor(None, self._init_tool)
-            logger.info("Grammar analyzer initialized", language=self._language)
+        """Initialize LanguageTool.
+
+        A failed start is not retried; later calls raise the same error
+        instead of launching (or downloading) LanguageTool again.
+        """
+        # Concurrent analyze() calls must not each launch their own server
+        async with self._start_lock:
+            if self._start_error is not None:
+                raise self._start_error
+            if self._tool is None:
+                # LanguageTool initialization is blocking, run in executor
+                loop = asyncio.get_event_loop()
+                try:
+                    self._tool = await loop.run_in_executor(None, self._init_tool)
+                except Exception as e:
+                    self._start_error = e
+                    raise
+                logger.info("Grammar analyzer initialized", language=self._language)
 
     def _init_tool(self):
         """Initialize LanguageTool (blocking)."""
@@ -99,6 +113,30 @@ class GrammarAnalyzer(BaseAnalyzer):
             logger.error("Grammar analysis failed", file=str(text_path), error=str(e))
             return []
 
+    async def analyze_batch(
+        self, text_paths: list[Path], batch_size: int | None = None
+    ) -> list[GrammarIssue]:
+        """
+        Analyze multiple text files, checking each batch concurrently.
+
+        Args:
+            text_paths: Paths to the text files to analyze.
+            batch_size: Files per batch (defaults to ``settings.grammar_batch_size``).
+
+        Returns:
+            Grammar issues for all files, in input order.
+        """
+        await self.start()
+
+        batch_size = batch_size or settings.grammar_batch_size
+        all_issues = []
+        for i in range(0, len(text_paths), batch_size):
+            batch = text_paths[i : i + batch_size]
+            for issues in await asyncio.gather(*(self.analyze(path) for path in batch)):
+                all_issues.extend(issues)
+
+        return all_issues
+
     async def analyze_text(self, text: str, source_url: str = "") -> list[GrammarIssue]:
         """
         Analyze raw text for grammar issues.
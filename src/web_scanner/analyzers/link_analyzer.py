@@ -21,6 +21,8 @@ class LinkAnalyzer(BaseAnalyzer):
         self._client: httpx.AsyncClient | None = None
         self._semaphore = asyncio.Semaphore(10)  # Limit concurrent requests
         self._checked_urls: dict[str, tuple[int | None, str | None]] = {}
+        # Targets the last analyze() call ran out of time to check
+        self.unchecked_urls: list[str] = []
 
     async def start(self) -> None:
         """Initialize HTTP client."""
@@ -70,34 +72,60 @@ class LinkAnalyzer(BaseAnalyzer):
             self._checked_urls[url] = result
             return result
 
-    async def analyze(self, pages: list[CrawledPage]) -> list[LinkIssue]:
+    async def analyze(
+        self, pages: list[CrawledPage], timeout: float | None = None
+    ) -> list[LinkIssue]:
         """
         Analyze all pages for broken links.
 
         Args:
             pages: List of crawled pages to analyze.
+            timeout: Seconds to spend checking links; checks still running
+                then are cancelled and listed in ``unchecked_urls``, and the
+                links already checked are reported as usual.
 
         Returns:
             List of link issues found.
         """
         await self.start()
 
-        issues = []
-        base_domains = set()
+        successful = [page for page in pages if page.status is PageStatus.SUCCESS]
 
         # Collect all base domains from successful pages
-        for page in pages:
-            if page.status == PageStatus.SUCCESS:
-                parsed = urlparse(page.url)
-                base_domains.add(parsed.netloc)
-
-        # Check links from each page
-        for page in pages:
-            if page.status != PageStatus.SUCCESS or not page.links:
-                continue
+        base_domains = {urlparse(page.url).netloc for page in successful}
+
+        # Build every (source, target) edge to check, in page order
+        edges: list[tuple[str, str]] = []
+        netlocs: dict[str, str] = {}
+        for page in successful:
+            for link in page.links:
+                netloc = netlocs.get(link)
+                if netloc is None:
+                    netloc = netlocs[link] = urlparse(link).netloc
+
+                # Skip external links if not configured to check them
+                if netloc in base_domains or self.check_external:
+                    edges.append((page.url, link))
+
+        # Request each distinct target once, across all pages at the same time
+        targets = dict.fromkeys(target for _, target in edges)
+        checks = [asyncio.ensure_future(self._check_url(target)) for target in targets]
+        if checks:
+            _, pending = await asyncio.wait(checks, timeout=timeout)
+            for check in pending:
+                check.cancel()
+            await asyncio.gather(*checks, return_exceptions=True)
+
+        self.unchecked_urls = [target for target in targets if target not in self._checked_urls]
 
-            page_issues = await self._analyze_page_links(page, base_domains)
-            issues.extend(page_issues)
+        issues = []
+        for source_url, target_url in edges:
+            result = self._checked_urls.get(target_url)
+            if result is None:
+                continue
+            issue = self._classify(source_url, target_url, *result)
+            if issue:
+                issues.append(issue)
 
         logger.info("Link analysis complete", total_issues=len(issues))
         return issues
@@ -130,7 +158,16 @@ class LinkAnalyzer(BaseAnalyzer):
     async def _check_link(self, source_url: str, target_url: str) -> LinkIssue | None:
         """Check a single link and return issue if broken."""
         status_code, error_message = await self._check_url(target_url)
-
+        return self._classify(source_url, target_url, status_code, error_message)
+
+    def _classify(
+        self,
+        source_url: str,
+        target_url: str,
+        status_code: int | None,
+        error_message: str | None,
+    ) -> LinkIssue | None:
+        """Turn a URL check result into a link issue, or None if the link is fine."""
         # Determine if this is an issue
         is_issue = False
         error_type = ""
@@ -171,7 +208,7 @@ class LinkAnalyzer(BaseAnalyzer):
         """Analyze links from a single page."""
         await self.start()
 
-        if page.status != PageStatus.SUCCESS or not page.links:
+        if page.status is not PageStatus.SUCCESS or not page.links:
             return []
 
         base_domain = urlparse(page.url).netloc
@@ -1,6 +1,8 @@
 """OCR analyzer for extracting and analyzing text from screenshots."""
 
 import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import structlog
@@ -20,13 +22,24 @@ class OCRAnalyzer(BaseAnalyzer):
     def __init__(self):
         self._grammar_analyzer = GrammarAnalyzer()
         self._tesseract_lang = settings.tesseract_lang
+        self._executor: ThreadPoolExecutor | None = None
 
     async def start(self) -> None:
         """Initialize resources."""
+        # Tesseract runs as a subprocess, so a thread per worker gives real
+        # parallelism without tying up the default executor grammar checks use
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=settings.ocr_workers or os.cpu_count(),
+                thread_name_prefix="ocr",
+            )
         await self._grammar_analyzer.start()
 
     async def stop(self) -> None:
         """Clean up resources."""
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
         await self._grammar_analyzer.stop()
 
     def _extract_text_from_image(self, image_path: Path) -> tuple[str, float]:
@@ -85,7 +98,7 @@ class OCRAnalyzer(BaseAnalyzer):
             # Extract text from image (blocking operation)
             loop = asyncio.get_event_loop()
             extracted_text, confidence = await loop.run_in_executor(
-                None, self._extract_text_from_image, screenshot_path
+                self._executor, self._extract_text_from_image, screenshot_path
             )
 
             if not extracted_text or confidence < 0.3:
@@ -174,12 +187,11 @@ class OCRAnalyzer(BaseAnalyzer):
         return issues
 
     async def analyze_batch(self, screenshot_paths: list[Path]) -> list[OCRIssue]:
-        """Analyze multiple screenshots."""
+        """Analyze multiple screenshots, up to ``ocr_workers`` at a time."""
         await self.start()
 
         all_issues = []
-        for path in screenshot_paths:
-            issues = await self.analyze(path)
+        for issues in await asyncio.gather(*(self.analyze(path) for path in screenshot_paths)):
             all_issues.extend(issues)
 
         return all_issues
@@ -30,6 +30,9 @@ def scan(
     skip_grammar: bool = typer.Option(False, "--no-grammar", help="Skip grammar analysis"),
     skip_links: bool = typer.Option(False, "--no-links", help="Skip broken link analysis"),
     skip_ocr: bool = typer.Option(False, "--no-ocr", help="Skip OCR analysis"),
+    ephemeral: bool = typer.Option(
+        False, "--ephemeral", help="Don't save extracted HTML/text files to disk"
+    ),
     # AI Analysis options
     enable_ai: bool = typer.Option(False, "--ai", help="Enable AI-powered analysis (requires API key)"),
     ai_api_key: str = typer.Option(
@@ -96,6 +99,7 @@ def scan(
             ai_analyze_html=not no_ai_html,
             ai_analyze_screenshots=not no_ai_visual,
             output_dir=output_dir,
+            persist_extracted=not ephemeral,
         )
 
         # Run the scan
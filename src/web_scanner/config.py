@@ -37,9 +37,29 @@ class Settings(BaseSettings):
         description="Maximum retries for failed page loads",
     )
 
+    # Extraction settings
+    extract_concurrency: int = Field(
+        default=16,
+        description="Max pages whose HTML/text are being written to disk at once",
+    )
+    extract_autoscale: bool = Field(
+        default=False,
+        description="Adjust extraction concurrency to live CPU and memory load (opt-in)",
+    )
+    extract_concurrency_max: int = Field(
+        default=64, description="Upper bound for extraction concurrency when autoscaling"
+    )
+    dedupe_pages: bool = Field(
+        default=True,
+        description="Skip grammar checks for pages whose text repeats an earlier page",
+    )
+
     # Storage settings
     output_dir: Path = Field(default=Path("./data"), description="Output directory for data")
     reports_dir: Path = Field(default=Path("./reports"), description="Reports directory")
+    compress_report: bool = Field(
+        default=False, description="Gzip the JSON analysis report (analysis_report.json.gz)"
+    )
 
     # Screenshot settings
     screenshot_width: int = Field(default=1920, description="Screenshot viewport width")
@@ -48,10 +68,26 @@ class Settings(BaseSettings):
 
     # Analyzer settings
     grammar_language: str = Field(default="en-US", description="Language for grammar checking")
+    grammar_batch_size: int = Field(
+        default=16, description="Text files checked together per grammar batch"
+    )
     check_external_links: bool = Field(default=False, description="Check external links")
+    grammar_timeout: float | None = Field(
+        default=None, description="Seconds before unfinished grammar checks are abandoned"
+    )
+    link_timeout: float | None = Field(
+        default=None, description="Seconds before unfinished link checks are abandoned"
+    )
+    ocr_timeout: float | None = Field(
+        default=None, description="Seconds before unfinished OCR batches are abandoned"
+    )
 
     # OCR settings
     tesseract_lang: str = Field(default="eng", description="Tesseract OCR language")
+    ocr_batch_size: int = Field(default=8, description="Screenshots analyzed per OCR batch")
+    ocr_workers: int | None = Field(
+        default=None, description="Parallel Tesseract runs (defaults to the CPU count)"
+    )
 
     # AI/OpenRouter settings
     openrouter_api_key: str | None = Field(
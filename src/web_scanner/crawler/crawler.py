@@ -1,11 +1,15 @@
 """Core web crawler implementation using Playwright for JavaScript support."""
 
 import asyncio
+import re
 import time
+from collections.abc import AsyncGenerator
+from html import unescape
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 
 import structlog
+from bs4 import BeautifulSoup, SoupStrainer
 from playwright.async_api import Page, TimeoutError as PlaywrightTimeout
 
 from ..browser import BrowserManager, SmartPageLoader, retry_with_backoff
@@ -14,6 +18,24 @@ from ..models import CrawledPage, PageStatus
 
 logger = structlog.get_logger()
 
+# ASCII URLs that _normalize_url() would return unchanged: lowercase http(s)
+# scheme, no fragment, no path parameters, no empty query, no whitespace
+_NORMALIZED_URL = re.compile(r"https?://[^/?#\[\]\s]+(?:/[^?#;\s]*)?(?:\?[^#\s]+)?")
+
+# Paths ending in these extensions are resources, not pages
+_SKIP_EXTENSIONS = re.compile(
+    r"\.(?:pdf|jpe?g|png|gif|svg|ico|css|js|xml|json|zip|tar|gz"
+    r"|mp3|mp4|avi|mov|webm|woff2?|ttf|eot|map)\Z",
+    re.IGNORECASE,
+)
+
+# Link extraction only needs anchors; BeautifulSoup skips building tree
+# nodes for everything else
+_ANCHORS = SoupStrainer("a", href=True)
+
+# The title is a single text-only element; a regex finds it without parsing
+_TITLE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+
 
 class WebCrawler:
     """
@@ -44,13 +66,23 @@ class WebCrawler:
         self.capture_screenshots = capture_screenshots
 
         self.visited_urls: set[str] = set()
+        # Every URL ever put on the queue, so each one is queued only once
+        self._queued_urls: set[str] = set()
+        # One shared string per distinct URL, however many pages link to it
+        self._url_pool: dict[str, str] = {}
         self.crawled_pages: list[CrawledPage] = []
         self.url_queue: asyncio.Queue[tuple[str, int]] = asyncio.Queue()
+        # Fetched pages handed to iter_crawl(); None marks the end of the crawl
+        self._results: asyncio.Queue[CrawledPage | None] = asyncio.Queue()
         self._semaphore: asyncio.Semaphore | None = None
         self._browser_manager: BrowserManager | None = None
 
     def _normalize_url(self, url: str) -> str:
         """Normalize a URL by removing fragments and trailing slashes."""
+        # Most links are already in normal form; skip parsing those
+        if url.isascii() and _NORMALIZED_URL.fullmatch(url) and not url.endswith("/"):
+            return url
+
         parsed = urlparse(url)
         normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
         if parsed.query:
@@ -71,14 +103,7 @@ class WebCrawler:
                 return False
 
             # Skip common non-page resources
-            skip_extensions = (
-                ".pdf", ".jpg", ".jpeg", ".png", ".gif", ".svg", ".ico",
-                ".css", ".js", ".xml", ".json", ".zip", ".tar", ".gz",
-                ".mp3", ".mp4", ".avi", ".mov", ".webm", ".woff", ".woff2",
-                ".ttf", ".eot", ".map",
-            )
-            path_lower = parsed.path.lower()
-            if any(path_lower.endswith(ext) for ext in skip_extensions):
+            if _SKIP_EXTENSIONS.search(parsed.path):
                 return False
 
             return True
@@ -104,15 +129,69 @@ class WebCrawler:
     def _filter_links(self, links: list[str], current_url: str) -> list[str]:
         """Filter and normalize extracted links."""
         filtered = []
+        seen: set[str] = set()
         for link in links:
+            normalized = self._normalize_and_validate(link, current_url)
+
+            if normalized and normalized not in seen:
+                normalized = self._url_pool.setdefault(normalized, normalized)
+                seen.add(normalized)
+                filtered.append(normalized)
+
+        return filtered
+
+    def _normalize_and_validate(self, link: str, current_url: str) -> str | None:
+        """Resolve, normalize and validate a link, parsing it only once.
+
+        Equivalent to _normalize_url() followed by _is_valid_url(); returns
+        None for links that should not be crawled.
+        """
+        try:
             # Convert relative URLs to absolute
             absolute_url = urljoin(current_url, link)
+            parsed = urlparse(absolute_url)
+        except ValueError:
+            return None
+
+        # Rare shapes whose normalized form parses differently the second time
+        if ";" in absolute_url or not parsed.netloc:
             normalized = self._normalize_url(absolute_url)
+            return normalized if self._is_valid_url(normalized) else None
 
-            if self._is_valid_url(normalized) and normalized not in filtered:
-                filtered.append(normalized)
+        if parsed.netloc != self.base_domain or parsed.scheme not in ("http", "https"):
+            return None
 
-        return filtered
+        # Without a query, normalizing strips trailing slashes off the path itself
+        path = parsed.path if parsed.query else parsed.path.rstrip("/")
+        if _SKIP_EXTENSIONS.search(path):
+            return None
+
+        normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+        if parsed.query:
+            normalized += f"?{parsed.query}"
+        return normalized.rstrip("/")
+
+    def _extract_links(self, html: str, base_url: str) -> list[str]:
+        """Extract crawlable links from raw HTML."""
+        soup = BeautifulSoup(html, "lxml", parse_only=_ANCHORS)
+        hrefs = [a["href"] for a in soup.find_all("a", href=True)]
+        return self._filter_links(hrefs, base_url)
+
+    def _extract_text(self, html: str) -> str:
+        """Extract visible text from raw HTML."""
+        soup = BeautifulSoup(html, "lxml")
+        # get_text() already skips script and style contents; only noscript
+        # holds ordinary strings that need removing
+        for tag in soup("noscript"):
+            tag.decompose()
+        return soup.get_text(separator="\n", strip=True)
+
+    def _extract_title(self, html: str) -> str | None:
+        """Extract the page title from raw HTML."""
+        match = _TITLE.search(html)
+        if match:
+            return unescape(match.group(1)).strip() or None
+        return None
 
     async def _fetch_page(
         self,
@@ -236,17 +315,30 @@ class WebCrawler:
                 async with self._browser_manager.new_page() as page:
                     crawled_page = await self._fetch_page(url, depth, page)
                     self.crawled_pages.append(crawled_page)
+                    self._results.put_nowait(crawled_page)
 
                     # Add discovered links to queue
-                    if crawled_page.status == PageStatus.SUCCESS and depth < self.max_depth:
+                    if crawled_page.status is PageStatus.SUCCESS and depth < self.max_depth:
                         for link in crawled_page.links:
-                            if link not in self.visited_urls:
+                            if link not in self._queued_urls:
+                                self._queued_urls.add(link)
                                 await self.url_queue.put((link, depth + 1))
 
             self.url_queue.task_done()
 
     async def crawl(self) -> list[CrawledPage]:
         """Start crawling from the base URL."""
+        async for _ in self.iter_crawl():
+            pass
+
+        return self.crawled_pages
+
+    async def iter_crawl(self) -> AsyncGenerator[CrawledPage, None]:
+        """Crawl from the base URL, yielding each page as soon as it is fetched.
+
+        Lets callers process pages while the rest of the site is still being
+        crawled. Pages are also collected in ``crawled_pages`` as before.
+        """
         logger.info(
             "Starting crawl",
             base_url=self.base_url,
@@ -261,27 +353,37 @@ class WebCrawler:
             self.screenshot_dir.mkdir(parents=True, exist_ok=True)
 
         # Start with the base URL
+        self._queued_urls.add(self.base_url)
         await self.url_queue.put((self.base_url, 0))
 
         # Initialize browser manager
         self._browser_manager = BrowserManager()
         await self._browser_manager.start()
 
-        try:
-            # Create worker tasks
-            workers = [
-                asyncio.create_task(self._worker(i))
-                for i in range(self.concurrent_requests)
-            ]
-
-            # Wait for all work to complete
+        async def signal_done() -> None:
             await self.url_queue.join()
+            self._results.put_nowait(None)
 
-            # Cancel workers
-            for worker in workers:
-                worker.cancel()
+        # Create worker tasks
+        workers = [
+            asyncio.create_task(self._worker(i))
+            for i in range(self.concurrent_requests)
+        ]
+        done = asyncio.create_task(signal_done())
+
+        try:
+            # Hand pages over until all work is complete
+            while (crawled_page := await self._results.get()) is not None:
+                yield crawled_page
 
         finally:
+            # Cancel workers (also when the caller stops iterating early)
+            for task in (*workers, done):
+                task.cancel()
+
+            # Let cancelled workers close their pages before the browser goes away
+            await asyncio.gather(*workers, done, return_exceptions=True)
+
             # Always cleanup browser
             await self._browser_manager.stop()
 
@@ -290,5 +392,3 @@ class WebCrawler:
             pages_crawled=len(self.crawled_pages),
             urls_discovered=len(self.visited_urls),
         )
-
-        return self.crawled_pages
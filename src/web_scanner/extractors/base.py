@@ -1,10 +1,39 @@
 """Base extractor interface."""
 
+import asyncio
+import re
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
+from urllib.parse import urlparse
 
 from ..models import CrawledPage
 
+# Query separators get readable stand-ins before sanitizing
+_QUERY_CHARS = str.maketrans({"&": "_", "=": "-"})
+
+# Any character that is not safe in a filename is replaced with "_"
+_UNSAFE_FILENAME_CHAR = re.compile(r"[^A-Za-z0-9_-]")
+
+
+# Every extractor asks for the same page URL with its own extension, so the
+# stem is cached across all extractor instances
+@lru_cache(maxsize=4096)
+def _filename_stem(url: str) -> str:
+    """Convert a URL to a safe filename without extension."""
+    parsed = urlparse(url)
+    path = parsed.path.strip("/").replace("/", "_") or "index"
+
+    if parsed.query:
+        path = f"{path}_{parsed.query.translate(_QUERY_CHARS)}"
+
+    # Truncate if too long
+    if len(path) > 200:
+        path = path[:200]
+
+    # Remove any unsafe characters
+    return _UNSAFE_FILENAME_CHAR.sub("_", path)
+
 
 class BaseExtractor(ABC):
     """Abstract base class for all extractors."""
@@ -26,23 +55,11 @@ class BaseExtractor(ABC):
         """
         pass
 
+    async def _write_text(self, filepath: Path, content: str) -> None:
+        """Write a UTF-8 text file off the event loop in a single thread hop."""
+        await asyncio.to_thread(filepath.write_text, content, encoding="utf-8")
+
     def _url_to_filename(self, url: str, extension: str) -> str:
         """Convert a URL to a safe filename."""
-        from urllib.parse import urlparse
-
-        parsed = urlparse(url)
-        path = parsed.path.strip("/").replace("/", "_") or "index"
-
-        if parsed.query:
-            query_safe = parsed.query.replace("&", "_").replace("=", "-")
-            path = f"{path}_{query_safe}"
-
-        # Truncate if too long
-        if len(path) > 200:
-            path = path[:200]
-
-        # Remove any unsafe characters
-        safe_chars = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_")
-        path = "".join(c if c in safe_chars else "_" for c in path)
+        return f"{_filename_stem(url)}.{extension}"
 
-        return f"{path}.{extension}"
@@ -2,7 +2,6 @@
 
 from pathlib import Path
 
-import aiofiles
 import structlog
 
 from ..models import CrawledPage, PageStatus
@@ -19,7 +18,7 @@ class HTMLExtractor(BaseExtractor):
 
     async def extract(self, page: CrawledPage) -> Path | None:
         """Extract and save HTML content."""
-        if page.status != PageStatus.SUCCESS or not page.html:
+        if page.status is not PageStatus.SUCCESS or not page.html:
             logger.debug("Skipping HTML extraction", url=page.url, status=page.status)
             return None
 
@@ -27,8 +26,7 @@ class HTMLExtractor(BaseExtractor):
         filepath = self.output_dir / filename
 
         try:
-            async with aiofiles.open(filepath, "w", encoding="utf-8") as f:
-                await f.write(page.html)
+            await self._write_text(filepath, page.html)
 
             logger.info("Saved HTML", url=page.url, path=str(filepath))
             return filepath
@@ -60,7 +60,7 @@ class ScreenshotExtractor(BaseExtractor):
 
     async def extract(self, page: CrawledPage) -> Path | None:
         """Capture screenshot of the page."""
-        if page.status != PageStatus.SUCCESS:
+        if page.status is not PageStatus.SUCCESS:
             logger.debug("Skipping screenshot", url=page.url, status=page.status)
             return None
 
@@ -2,7 +2,6 @@
 
 from pathlib import Path
 
-import aiofiles
 import structlog
 
 from ..models import CrawledPage, PageStatus
@@ -19,7 +18,7 @@ class TextExtractor(BaseExtractor):
 
     async def extract(self, page: CrawledPage) -> Path | None:
         """Extract and save text content."""
-        if page.status != PageStatus.SUCCESS or not page.text:
+        if page.status is not PageStatus.SUCCESS or not page.text:
             logger.debug("Skipping text extraction", url=page.url, status=page.status)
             return None
 
@@ -35,8 +34,7 @@ class TextExtractor(BaseExtractor):
             content += "-" * 80 + "\n\n"
             content += page.text
 
-            async with aiofiles.open(filepath, "w", encoding="utf-8") as f:
-                await f.write(content)
+            await self._write_text(filepath, content)
 
             logger.info("Saved text", url=page.url, path=str(filepath))
             return filepath
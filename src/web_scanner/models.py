@@ -16,7 +16,7 @@ class PageStatus(Enum):
     NOT_FOUND = "not_found"
 
 
-@dataclass
+@dataclass(slots=True)
 class CrawledPage:
     """Represents a crawled page with its metadata."""
 
@@ -35,7 +35,7 @@ class CrawledPage:
     screenshot_path: str | None = None  # Path to captured screenshot
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedData:
     """Container for all extracted data from a page."""
 
@@ -43,10 +43,12 @@ class ExtractedData:
     html_path: Path | None = None
     text_path: Path | None = None
     screenshot_path: Path | None = None
+    text_content: str | None = None  # Page text kept in memory when files aren't persisted
+    duplicate_of: str | None = None  # URL of an earlier page with the same text
     metadata: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class GrammarIssue:
     """Represents a grammar or spelling issue."""
 
@@ -59,7 +61,7 @@ class GrammarIssue:
     category: str
 
 
-@dataclass
+@dataclass(slots=True)
 class LinkIssue:
     """Represents a broken or problematic link."""
 
@@ -70,7 +72,7 @@ class LinkIssue:
     error_message: str
 
 
-@dataclass
+@dataclass(slots=True)
 class OCRIssue:
     """Represents an issue found via OCR analysis."""
 
@@ -81,7 +83,7 @@ class OCRIssue:
     confidence: float
 
 
-@dataclass
+@dataclass(slots=True)
 class AIIssue:
     """Represents an issue found by AI analysis."""
 
@@ -98,7 +100,7 @@ class AIIssue:
     confidence: int | None = None  # 1-5 confidence score
 
 
-@dataclass
+@dataclass(slots=True)
 class TextCorrection:
     """Represents a text correction found in screenshot analysis."""
 
@@ -109,7 +111,7 @@ class TextCorrection:
     confidence: int | None = None  # 1-5 confidence score
 
 
-@dataclass
+@dataclass(slots=True)
 class AIPageAnalysis:
     """AI analysis result for a single page."""
 
@@ -124,7 +126,7 @@ class AIPageAnalysis:
     visual_score: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisReport:
     """Complete analysis report for a scanned website."""
 
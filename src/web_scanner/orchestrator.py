@@ -1,20 +1,65 @@
 """Main orchestrator that coordinates crawling, extraction, and analysis."""
 
 import asyncio
+import hashlib
+from collections.abc import Awaitable
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar
 
 import structlog
 
 from .config import settings
 from .crawler import WebCrawler
-from .extractors import HTMLExtractor, TextExtractor
+from .extractors import BaseExtractor, HTMLExtractor, TextExtractor
 from .analyzers import GrammarAnalyzer, LinkAnalyzer, OCRAnalyzer
 from .storage import StorageManager
-from .models import AnalysisReport, CrawledPage, ExtractedData, PageStatus, AIPageAnalysis, AIIssue
+from .utils import AdaptiveLimiter, Autoscaler
+from .models import (
+    AIPageAnalysis,
+    AnalysisReport,
+    CrawledPage,
+    ExtractedData,
+    GrammarIssue,
+    OCRIssue,
+    PageStatus,
+)
+
+# AI support is optional; resolve it once at import instead of on every scan
+try:
+    from .ai import AIAnalyzer
+except ImportError as _ai_import_error:
+    AIAnalyzer = None
+    _AI_IMPORT_ERROR: ImportError | None = _ai_import_error
+else:
+    _AI_IMPORT_ERROR = None
+
+if TYPE_CHECKING:
+    from .ai.analyzer import AIAnalysisResult
 
 logger = structlog.get_logger()
 
+T = TypeVar("T")
+
+
+def _to_page_analysis(ai_result: "AIAnalysisResult") -> AIPageAnalysis:
+    """Convert an AI analyzer result into the report model.
+
+    AI results already carry model ``AIIssue`` objects, so the lists are
+    attached as-is rather than copied issue by issue.
+    """
+    return AIPageAnalysis(
+        url=ai_result.url,
+        text_issues=ai_result.text_issues,
+        html_issues=ai_result.html_issues,
+        visual_issues=ai_result.visual_issues,
+        text_corrections=ai_result.text_corrections,
+        text_summary=ai_result.text_summary,
+        html_summary=ai_result.html_summary,
+        visual_summary=ai_result.visual_summary,
+        visual_score=ai_result.visual_score,
+    )
+
 
 class ScanOrchestrator:
     """Orchestrates the complete website scanning and analysis workflow.
@@ -39,6 +84,8 @@ class ScanOrchestrator:
         ai_analyze_html: bool = True,
         ai_analyze_screenshots: bool = True,
         output_dir: Path | None = None,
+        persist_extracted: bool = True,
+        max_extract_concurrency: int | None = None,
     ):
         self.url = url
         self.max_depth = max_depth or settings.max_depth
@@ -52,6 +99,20 @@ class ScanOrchestrator:
         self.ai_analyze_text = ai_analyze_text
         self.ai_analyze_html = ai_analyze_html
         self.ai_analyze_screenshots = ai_analyze_screenshots and not skip_screenshots
+        self.persist_extracted = persist_extracted
+        self.max_extract_concurrency = max_extract_concurrency or settings.extract_concurrency
+
+        # Extraction concurrency starts at max_extract_concurrency and, when
+        # autoscaling is on, follows the machine's CPU and memory headroom
+        self._extract_limiter = AdaptiveLimiter(
+            self.max_extract_concurrency,
+            max_limit=(
+                max(self.max_extract_concurrency, settings.extract_concurrency_max)
+                if settings.extract_autoscale
+                else None
+            ),
+        )
+        self._autoscaler_task: asyncio.Task[None] | None = None
 
         # Initialize storage
         self.storage = StorageManager(url, output_dir)
@@ -80,9 +141,22 @@ class ScanOrchestrator:
 
         # Results
         self.crawled_pages: list[CrawledPage] = []
+        self._successful_pages: list[CrawledPage] = []
         self.extracted_data: list[ExtractedData] = []
         self.report: AnalysisReport | None = None
 
+        # Extractions started while the crawl is still running
+        self._pending_extractions: list[asyncio.Task[ExtractedData]] = []
+
+        # Grammar and OCR checks started while extraction is still running
+        self._pending_grammar: list[asyncio.Task[list[GrammarIssue]]] = []
+        self._grammar_batch: list[Path] = []
+        self._pending_ocr: list[asyncio.Task[list[OCRIssue]]] = []
+        self._ocr_batch: list[Path] = []
+
+        # Text fingerprint -> URL of the first page seen with that text
+        self._text_fingerprints: dict[bytes, str] = {}
+
     async def run(self) -> AnalysisReport:
         """Run the complete scan workflow."""
         logger.info("Starting scan", url=self.url)
@@ -93,35 +167,41 @@ class ScanOrchestrator:
             scan_started=start_time,
         )
 
+        if settings.extract_autoscale:
+            self._autoscaler_task = asyncio.create_task(Autoscaler(self._extract_limiter).run())
+
         try:
-            # Phase 1: Crawl (includes screenshots with Playwright)
+            # Phase 1: Crawl (includes screenshots with Playwright); content
+            # extraction starts as each page arrives
             logger.info("Phase 1: Crawling website with Playwright (JavaScript enabled)")
-            self.crawled_pages = await self.crawler.crawl()
+            await self._crawl()
             self.report.pages_crawled = len(self.crawled_pages)
 
-            # Save crawl metadata
-            await self.storage.save_crawl_metadata(self.crawled_pages)
-
-            # Phase 2: Extract and save content to files
+            # Phase 2: Extract and save content to files, writing the crawl
+            # metadata alongside rather than ahead of it
             logger.info("Phase 2: Saving extracted content")
-            await self._save_extracted_content()
+            await asyncio.gather(
+                self.storage.save_crawl_metadata(self.crawled_pages),
+                self._save_extracted_content(),
+            )
 
             # Save extraction index
             await self.storage.save_extracted_data_index(self.extracted_data)
+            await self.storage.save_analysis_report(self.report, checkpoint=True)
 
             # Phase 3: Analyze
             logger.info("Phase 3: Analyzing content")
             await self._analyze_content()
+            await self.storage.save_analysis_report(self.report, checkpoint=True)
 
             # Phase 4: AI Analysis (if enabled)
             if self.enable_ai:
                 logger.info("Phase 4: Running AI-powered analysis")
                 await self._run_ai_analysis()
+                await self.storage.save_analysis_report(self.report, checkpoint=True)
 
             self.report.scan_completed = datetime.now()
-            self.report.pages_analyzed = len([
-                p for p in self.crawled_pages if p.status == PageStatus.SUCCESS
-            ])
+            self.report.pages_analyzed = len(self._successful_pages)
 
             # Save final report
             report_path = await self.storage.save_analysis_report(self.report)
@@ -143,62 +223,204 @@ class ScanOrchestrator:
         finally:
             await self._cleanup()
 
+    async def _crawl(self) -> None:
+        """Crawl the site, starting extraction for each page as it is yielded.
+
+        Pages are extracted concurrently, as many at a time as the extraction
+        limiter allows, so disk writes overlap the remaining crawl.
+        """
+        async for page in self.crawler.iter_crawl():
+            self.crawled_pages.append(page)
+            if page.status is PageStatus.SUCCESS:
+                self._successful_pages.append(page)
+                self._pending_extractions.append(
+                    asyncio.create_task(self._extract_page(page))
+                )
+
     async def _save_extracted_content(self) -> None:
         """Save extracted content (HTML, text) to files.
 
-        Screenshots are already captured during crawl phase.
+        Screenshots are already captured during crawl phase. When
+        ``persist_extracted`` is off, nothing is written and the page text is
+        kept in memory for the analyzers instead.
+
+        Waits for the extractions started during the crawl;
+        ``extracted_data`` keeps the crawl order.
+        """
+        self.extracted_data = await asyncio.gather(*self._pending_extractions)
+        self._pending_extractions.clear()
+        self._stop_autoscaler()
+
+    def _stop_autoscaler(self) -> None:
+        """Stop adjusting extraction concurrency."""
+        if self._autoscaler_task:
+            self._autoscaler_task.cancel()
+            self._autoscaler_task = None
+
+    async def _extract_page(self, page: CrawledPage) -> ExtractedData:
+        """Extract a single page's content once a concurrency slot is free."""
+        # Runs before the first await, so the earliest page in crawl order is canonical
+        duplicate_of = self._find_duplicate(page)
+
+        html_path = text_path = text_content = None
+        if not self.persist_extracted:
+            text_content = page.text
+        else:
+            async with self._extract_limiter:
+                # Save HTML and text in parallel
+                async with asyncio.TaskGroup() as tg:
+                    html_task = tg.create_task(
+                        self._run_extractor("html", self.html_extractor, page)
+                    )
+                    text_task = tg.create_task(
+                        self._run_extractor("text", self.text_extractor, page)
+                    )
+
+            html_path = html_task.result()
+            text_path = text_task.result()
+
+        # Build the record once, with every field known
+        extracted = ExtractedData(
+            url=page.url,
+            html_path=html_path,
+            text_path=text_path,
+            # Screenshot was captured during crawl
+            screenshot_path=Path(page.screenshot_path) if page.screenshot_path else None,
+            text_content=text_content,
+            duplicate_of=duplicate_of,
+        )
+
+        self._release_page_body(page)
+        self._on_page_extracted(extracted)
+        return extracted
+
+    def _release_page_body(self, page: CrawledPage) -> None:
+        """Drop a page's HTML and text once nothing later in the scan reads them.
+
+        Link analysis and the crawl metadata only use URLs, links and titles;
+        AI analysis reads the bodies directly, so each is kept while its AI
+        check is enabled.
         """
-        successful_pages = [p for p in self.crawled_pages if p.status == PageStatus.SUCCESS]
+        if not (self.enable_ai and self.ai_analyze_html):
+            page.html = None
+        if not (self.enable_ai and self.ai_analyze_text):
+            page.text = None
+
+    async def _run_extractor(
+        self, name: str, extractor: BaseExtractor, page: CrawledPage
+    ) -> Path | None:
+        """Run one extractor, logging instead of raising so its sibling still completes."""
+        try:
+            return await extractor.extract(page)
+        except Exception as e:
+            logger.warning("Extractor failed", extractor=name, url=page.url, error=str(e))
+            return None
 
-        for page in successful_pages:
-            extracted = ExtractedData(url=page.url)
+    def _find_duplicate(self, page: CrawledPage) -> str | None:
+        """Return the URL of an earlier page with the same text, if any.
 
-            # Save HTML and text in parallel
-            html_task = self.html_extractor.extract(page)
-            text_task = self.text_extractor.extract(page)
+        Template-driven sites often serve identical text under many URLs;
+        whitespace differences are ignored so re-rendered copies still match.
+        """
+        if not settings.dedupe_pages or not page.text:
+            return None
 
-            results = await asyncio.gather(html_task, text_task, return_exceptions=True)
+        normalized = " ".join(page.text.split())
+        fingerprint = hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
+        canonical = self._text_fingerprints.setdefault(fingerprint, page.url)
+        return canonical if canonical != page.url else None
 
-            if not isinstance(results[0], Exception):
-                extracted.html_path = results[0]
-            if not isinstance(results[1], Exception):
-                extracted.text_path = results[1]
+    def _on_page_extracted(self, extracted: ExtractedData) -> None:
+        """Start per-page analysis as soon as a page's content is available.
 
-            # Screenshot was captured during crawl
-            if page.screenshot_path:
-                extracted.screenshot_path = Path(page.screenshot_path)
+        Grammar and OCR checks only need the page's own text and screenshot,
+        so they run in the background while the remaining pages are still
+        being extracted. Saved text files and screenshots are checked in
+        batches of ``grammar_batch_size`` and ``ocr_batch_size``.
 
-            self.extracted_data.append(extracted)
+        Pages whose text duplicates an earlier page skip only the grammar
+        check; their screenshots can still differ, so OCR always runs.
+        """
+        if self.grammar_analyzer and not extracted.duplicate_of:
+            if extracted.text_path:
+                self._grammar_batch.append(extracted.text_path)
+                if len(self._grammar_batch) >= settings.grammar_batch_size:
+                    self._flush_grammar_batch()
+            elif extracted.text_content:
+                self._pending_grammar.append(
+                    asyncio.create_task(
+                        self._record_issues(
+                            "grammar",
+                            self.grammar_analyzer.analyze_text(
+                                extracted.text_content, source_url=extracted.url
+                            ),
+                        )
+                    )
+                )
 
-    async def _analyze_content(self) -> None:
-        """Run all analyzers on extracted content."""
-        tasks = []
+        if self.ocr_analyzer and extracted.screenshot_path:
+            self._ocr_batch.append(extracted.screenshot_path)
+            if len(self._ocr_batch) >= settings.ocr_batch_size:
+                self._flush_ocr_batch()
+
+    def _flush_grammar_batch(self) -> None:
+        """Start a grammar check for the text files collected so far."""
+        if self._grammar_batch:
+            self._pending_grammar.append(
+                asyncio.create_task(
+                    self._record_issues(
+                        "grammar", self.grammar_analyzer.analyze_batch(self._grammar_batch)
+                    )
+                )
+            )
+            self._grammar_batch = []
+
+    def _flush_ocr_batch(self) -> None:
+        """Start OCR analysis for the screenshots collected so far."""
+        if self._ocr_batch:
+            self._pending_ocr.append(
+                asyncio.create_task(
+                    self._record_issues("ocr", self.ocr_analyzer.analyze_batch(self._ocr_batch))
+                )
+            )
+            self._ocr_batch = []
+
+    async def _record_issues(self, kind: str, check: Awaitable[list[T]]) -> list[T]:
+        """Await an analyzer call and append its issues to the JSONL log right away."""
+        issues = await check
+        await self.storage.append_issues(kind, issues)
+        return issues
 
-        # Grammar analysis
-        if self.grammar_analyzer:
-            tasks.append(self._run_grammar_analysis())
+    async def _analyze_content(self) -> None:
+        """Run all analyzers on extracted content.
 
-        # Link analysis
-        if self.link_analyzer:
-            tasks.append(self._run_link_analysis())
+        Each ``_run_*`` coroutine records its own failures on the report, so
+        one analyzer failing does not cancel its siblings in the task group.
+        """
+        async with asyncio.TaskGroup() as tg:
+            # Grammar analysis
+            if self.grammar_analyzer:
+                tg.create_task(self._run_grammar_analysis())
 
-        # OCR analysis
-        if self.ocr_analyzer:
-            tasks.append(self._run_ocr_analysis())
+            # Link analysis
+            if self.link_analyzer:
+                tg.create_task(self._run_link_analysis())
 
-        # Run analyses in parallel
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+            # OCR analysis
+            if self.ocr_analyzer:
+                tg.create_task(self._run_ocr_analysis())
 
     async def _run_grammar_analysis(self) -> None:
-        """Run grammar analysis on extracted text."""
+        """Collect the grammar checks started during extraction."""
         logger.info("Running grammar analysis")
 
         try:
-            for extracted in self.extracted_data:
-                if extracted.text_path:
-                    issues = await self.grammar_analyzer.analyze(extracted.text_path)
-                    self.report.grammar_issues.extend(issues)
+            self._flush_grammar_batch()
+            results = await self._wait_for_checks(
+                "Grammar analysis", self._pending_grammar, settings.grammar_timeout
+            )
+            self._pending_grammar.clear()
+            self._collect_issues("Grammar analysis", results, self.report.grammar_issues)
 
             logger.info("Grammar analysis complete", issues=len(self.report.grammar_issues))
 
@@ -206,39 +428,98 @@ class ScanOrchestrator:
             logger.error("Grammar analysis failed", error=str(e))
             self.report.errors.append(f"Grammar analysis error: {str(e)}")
 
-        finally:
-            await self.grammar_analyzer.stop()
+    async def _wait_for_checks(
+        self, name: str, checks: list[asyncio.Task[list[T]]], timeout: float | None
+    ) -> list[list[T] | BaseException]:
+        """Wait for background checks, cancelling any still running after ``timeout``.
+
+        Results of the checks that finished come back in the order the checks
+        were started; the unfinished ones are recorded once in
+        ``report.errors`` instead of discarding everything found so far.
+        """
+        if not checks:
+            return []
+
+        done, pending = await asyncio.wait(checks, timeout=timeout)
+        if pending:
+            for check in pending:
+                check.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+            logger.error(
+                "Analyzer timed out", analyzer=name, timeout=timeout, unfinished=len(pending)
+            )
+            self.report.errors.append(
+                f"{name} timed out after {timeout:g}s; "
+                f"{len(pending)} of {len(checks)} checks unfinished"
+            )
+
+        return [
+            check.exception() or check.result()
+            for check in checks
+            if check in done and not check.cancelled()
+        ]
+
+    def _collect_issues(
+        self, name: str, results: list[list[T] | BaseException], issues: list[T]
+    ) -> None:
+        """Add each batch's issues to ``issues``, recording failed batches as errors.
+
+        A failed batch only loses its own pages; the issues every other batch
+        found are still reported. Batches that failed with the very same
+        exception, such as an analyzer that could not start, are reported once.
+        """
+        reported: set[int] = set()
+        for result in results:
+            if isinstance(result, BaseException):
+                if id(result) in reported:
+                    continue
+                reported.add(id(result))
+                logger.error("Analysis batch failed", analyzer=name, error=str(result))
+                self.report.errors.append(f"{name} error: {str(result)}")
+            else:
+                issues.extend(result)
 
     async def _run_link_analysis(self) -> None:
         """Run link analysis on crawled pages."""
         logger.info("Running link analysis")
 
         try:
-            issues = await self.link_analyzer.analyze(self.crawled_pages)
+            # Only successful pages carry links; the analyzer would filter to these anyway
+            issues = await self._record_issues(
+                "link",
+                self.link_analyzer.analyze(self._successful_pages, timeout=settings.link_timeout),
+            )
             self.report.link_issues.extend(issues)
+
+            if unchecked := len(self.link_analyzer.unchecked_urls):
+                logger.error(
+                    "Analyzer timed out",
+                    analyzer="Link analysis",
+                    timeout=settings.link_timeout,
+                    unfinished=unchecked,
+                )
+                self.report.errors.append(
+                    f"Link analysis timed out after {settings.link_timeout:g}s; "
+                    f"{unchecked} links unchecked"
+                )
             logger.info("Link analysis complete", issues=len(self.report.link_issues))
 
         except Exception as e:
             logger.error("Link analysis failed", error=str(e))
             self.report.errors.append(f"Link analysis error: {str(e)}")
 
-        finally:
-            await self.link_analyzer.stop()
-
     async def _run_ocr_analysis(self) -> None:
-        """Run OCR analysis on screenshots."""
+        """Collect the OCR checks started during extraction."""
         logger.info("Running OCR analysis")
 
         try:
-            screenshot_paths = [
-                extracted.screenshot_path
-                for extracted in self.extracted_data
-                if extracted.screenshot_path
-            ]
-
-            if screenshot_paths:
-                issues = await self.ocr_analyzer.analyze_batch(screenshot_paths)
-                self.report.ocr_issues.extend(issues)
+            self._flush_ocr_batch()
+            results = await self._wait_for_checks(
+                "OCR analysis", self._pending_ocr, settings.ocr_timeout
+            )
+            self._pending_ocr.clear()
+            self._collect_issues("OCR analysis", results, self.report.ocr_issues)
 
             logger.info("OCR analysis complete", issues=len(self.report.ocr_issues))
 
@@ -246,16 +527,13 @@ class ScanOrchestrator:
             logger.error("OCR analysis failed", error=str(e))
             self.report.errors.append(f"OCR analysis error: {str(e)}")
 
-        finally:
-            await self.ocr_analyzer.stop()
-
     async def _run_ai_analysis(self) -> None:
         """Run AI-powered analysis on content."""
         logger.info("Running AI analysis")
 
         try:
-            # Import here to avoid circular imports and make AI optional
-            from .ai import AIAnalyzer
+            if AIAnalyzer is None:
+                raise ImportError(str(_AI_IMPORT_ERROR))
 
             self.ai_analyzer = AIAnalyzer(
                 api_key=self.ai_api_key,
@@ -264,69 +542,20 @@ class ScanOrchestrator:
                 analyze_screenshots=self.ai_analyze_screenshots,
             )
 
-            # Get successful pages for analysis
-            successful_pages = [p for p in self.crawled_pages if p.status == PageStatus.SUCCESS]
-
-            if not successful_pages:
+            if not self._successful_pages:
                 logger.info("No pages to analyze with AI")
                 return
 
             # Run AI analysis on all pages
             ai_results = await self.ai_analyzer.analyze_batch(
-                pages=successful_pages,
+                pages=self._successful_pages,
                 extracted_data=self.extracted_data,
                 concurrency=settings.ai_analysis_concurrency,
             )
 
-            # Convert AI results to model format and add to report
+            # Add results to report
             for ai_result in ai_results:
-                page_analysis = AIPageAnalysis(
-                    url=ai_result.url,
-                    text_issues=[
-                        AIIssue(
-                            severity=issue.severity,
-                            category=issue.category,
-                            description=issue.description,
-                            location=issue.location,
-                            suggestion=issue.suggestion,
-                            original=issue.original,
-                            source_url=issue.source_url,
-                            source_type=issue.source_type,
-                        )
-                        for issue in ai_result.text_issues
-                    ],
-                    html_issues=[
-                        AIIssue(
-                            severity=issue.severity,
-                            category=issue.category,
-                            description=issue.description,
-                            location=issue.location,
-                            suggestion=issue.suggestion,
-                            original=issue.original,
-                            source_url=issue.source_url,
-                            source_type=issue.source_type,
-                        )
-                        for issue in ai_result.html_issues
-                    ],
-                    visual_issues=[
-                        AIIssue(
-                            severity=issue.severity,
-                            category=issue.category,
-                            description=issue.description,
-                            location=issue.location,
-                            suggestion=issue.suggestion,
-                            original=issue.original,
-                            source_url=issue.source_url,
-                            source_type=issue.source_type,
-                        )
-                        for issue in ai_result.visual_issues
-                    ],
-                    text_summary=ai_result.text_summary,
-                    html_summary=ai_result.html_summary,
-                    visual_summary=ai_result.visual_summary,
-                    visual_score=ai_result.visual_score,
-                )
-                self.report.ai_analyses.append(page_analysis)
+                self.report.ai_analyses.append(_to_page_analysis(ai_result))
 
                 # Add any errors from this page's analysis
                 for error in ai_result.errors:
@@ -360,20 +589,28 @@ class ScanOrchestrator:
             logger.error(error_msg)
             self.report.errors.append(error_msg)
 
-        finally:
-            if self.ai_analyzer:
-                await self.ai_analyzer.stop()
-
     async def _cleanup(self) -> None:
-        """Clean up resources."""
-        if self.grammar_analyzer:
-            await self.grammar_analyzer.stop()
-
-        if self.link_analyzer:
-            await self.link_analyzer.stop()
+        """Clean up resources.
 
-        if self.ocr_analyzer:
-            await self.ocr_analyzer.stop()
-
-        if self.ai_analyzer:
-            await self.ai_analyzer.stop()
+        Analyzers are stopped here only, all at once; their ``stop()`` methods
+        are no-ops once the underlying resource has been released.
+        """
+        self._stop_autoscaler()
+
+        # Extractions and grammar/OCR checks left behind by a scan that failed
+        # midway; they must finish unwinding before their analyzers are stopped
+        pending = (*self._pending_extractions, *self._pending_grammar, *self._pending_ocr)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        analyzers = (
+            self.grammar_analyzer,
+            self.link_analyzer,
+            self.ocr_analyzer,
+            self.ai_analyzer,
+        )
+        await asyncio.gather(
+            *(analyzer.stop() for analyzer in analyzers if analyzer),
+            return_exceptions=True,
+        )
@@ -1,61 +1,45 @@
 """HTML report generator for beautiful, modern static reports."""
 
 import html
+import re
+from bisect import bisect_right
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
+from typing import TYPE_CHECKING, TextIO
 
-from ..models import AnalysisReport
+if TYPE_CHECKING:
+    from ..models import AnalysisReport
 
+# The static markup below is indented for reading the source; that whitespace
+# is stripped once at import so reports don't carry it
+_LEADING_WHITESPACE = re.compile(r"^[ \t]+", re.MULTILINE)
+_CSS_WHITESPACE = re.compile(r"\s+")
+_CSS_PUNCTUATION_SPACING = re.compile(r" ?([{};]) ?")
 
-def generate_html_report(report: AnalysisReport, output_path: Path) -> Path:
-    """Generate a beautiful static HTML report."""
 
-    # Calculate stats
-    total_issues = (
-        len(report.grammar_issues) +
-        len(report.link_issues) +
-        len(report.ocr_issues)
-    )
-
-    ai_stats = {}
-    if report.ai_analyses:
-        ai_stats = {
-            "pages": len(report.ai_analyses),
-            "text_issues": sum(len(a.text_issues) for a in report.ai_analyses),
-            "html_issues": sum(len(a.html_issues) for a in report.ai_analyses),
-            "visual_issues": sum(len(a.visual_issues) for a in report.ai_analyses),
-        }
-        ai_stats["total"] = ai_stats["text_issues"] + ai_stats["html_issues"] + ai_stats["visual_issues"]
+def _minify_markup(markup: str) -> str:
+    """Drop the leading indentation of every line."""
+    return _LEADING_WHITESPACE.sub("", markup)
 
-        # Count by severity
-        all_issues = []
-        for a in report.ai_analyses:
-            all_issues.extend(a.text_issues + a.html_issues + a.visual_issues)
-        ai_stats["critical"] = sum(1 for i in all_issues if i.severity == "critical")
-        ai_stats["warning"] = sum(1 for i in all_issues if i.severity == "warning")
-        ai_stats["info"] = sum(1 for i in all_issues if i.severity == "info")
 
-        # Average visual score
-        scores = [a.visual_score for a in report.ai_analyses if a.visual_score is not None]
-        ai_stats["avg_score"] = sum(scores) / len(scores) if scores else None
+def _minify_css(css: str) -> str:
+    """Collapse whitespace runs and drop the spaces around braces and semicolons."""
+    return _CSS_PUNCTUATION_SPACING.sub(r"\1", _CSS_WHITESPACE.sub(" ", css)).strip()
 
-    # Calculate duration
-    duration = ""
-    if report.scan_completed:
-        delta = report.scan_completed - report.scan_started
-        minutes, seconds = divmod(int(delta.total_seconds()), 60)
-        duration = f"{minutes}m {seconds}s" if minutes else f"{seconds}s"
 
-    # Generate HTML
-    html_content = f"""<!DOCTYPE html>
+# Static parts of the page, built once at import rather than on every report
+_HEAD_OPEN = _minify_markup("""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Web Scanner Report - {html.escape(report.base_url)}</title>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-        :root {{
+""")
+
+_STYLESHEET = """
+        :root {
             --primary: #6366f1;
             --primary-dark: #4f46e5;
             --success: #10b981;
@@ -72,54 +56,54 @@ def generate_html_report(report: AnalysisReport, output_path: Path) -> Path:
             --gray-700: #374151;
             --gray-800: #1f2937;
             --gray-900: #111827;
-        }}
+        }
 
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             min-height: 100vh;
             color: var(--gray-800);
             line-height: 1.6;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             padding: 2rem;
-        }}
+        }
 
         /* Header */
-        .header {{
+        .header {
             background: rgba(255, 255, 255, 0.95);
             backdrop-filter: blur(10px);
             border-radius: 1.5rem;
             padding: 2rem;
             margin-bottom: 2rem;
             box-shadow: 0 25px 50px -12px rgba(0, 0, 0, 0.25);
-        }}
+        }
 
-        .header-top {{
+        .header-top {
             display: flex;
             justify-content: space-between;
             align-items: flex-start;
             margin-bottom: 1.5rem;
             flex-wrap: wrap;
             gap: 1rem;
-        }}
+        }
 
-        .logo {{
+        .logo {
             display: flex;
             align-items: center;
             gap: 0.75rem;
-        }}
+        }
 
-        .logo-icon {{
+        .logo-icon {
             width: 48px;
             height: 48px;
             background: linear-gradient(135deg, var(--primary) 0%, var(--primary-dark) 100%);
@@ -129,21 +113,21 @@ def generate_html_report(report: AnalysisReport, output_path: Path) -> Path:
             justify-content: center;
             color: white;
             font-size: 1.5rem;
-        }}
+        }
 
-        .logo-text {{
+        .logo-text {
             font-size: 1.5rem;
             font-weight: 700;
             color: var(--gray-900);
-        }}
+        }
 
-        .scan-meta {{
+        .scan-meta {
             text-align: right;
             color: var(--gray-500);
             font-size: 0.875rem;
-        }}
+        }
 
-        .url-display {{
+        .url-display {
             background: var(--gray-100);
             padding: 1rem 1.5rem;
             border-radius: 0.75rem;
@@ -151,31 +135,31 @@ def generate_html_report(report: AnalysisReport, output_path: Path) -> Path:
             font-size: 1rem;
             color: var(--primary-dark);
             word-break: break-all;
-        }}
+        }
 
         /* Stats Grid */
-        .stats-grid {{
+        .stats-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 1.5rem;
             margin-bottom: 2rem;
-        }}
+        }
 
-        .stat-card {{
+        .stat-card {
             background: rgba(255, 255, 255, 0.95);
             backdrop-filter: blur(10px);
             border-radius: 1rem;
             padding: 1.5rem;
             box-shadow: 0 10px 40px -10px rgba(0, 0, 0, 0.2);
             transition: transform 0.2s, box-shadow 0.2s;
-        }}
+        }
 
-        .stat-card:hover {{
+        .stat-card:hover {
             transform: translateY(-4px);
             box-shadow: 0 20px 50px -10px rgba(0, 0, 0, 0.3);
-        }}
+        }
 
-        .stat-icon {{
+        .stat-icon {
             width: 48px;
             height: 48px;
             border-radius: 12px;
@@ -184,151 +168,151 @@ def generate_html_report(report: AnalysisReport, output_path: Path) -> Path:
             justify-content: center;
             font-size: 1.5rem;
             margin-bottom: 1rem;
-        }}
+        }
 
-        .stat-icon.primary {{ background: rgba(99, 102, 241, 0.1); color: var(--primary); }}
-        .stat-icon.success {{ background: rgba(16, 185, 129, 0.1); color: var(--success); }}
-        .stat-icon.warning {{ background: rgba(245, 158, 11, 0.1); color: var(--warning); }}
-        .stat-icon.danger {{ background: rgba(239, 68, 68, 0.1); color: var(--danger); }}
-        .stat-icon.info {{ background: rgba(59, 130, 246, 0.1); color: var(--info); }}
+        .stat-icon.primary { background: rgba(99, 102, 241, 0.1); color: var(--primary); }
+        .stat-icon.success { background: rgba(16, 185, 129, 0.1); color: var(--success); }
+        .stat-icon.warning { background: rgba(245, 158, 11, 0.1); color: var(--warning); }
+        .stat-icon.danger { background: rgba(239, 68, 68, 0.1); color: var(--danger); }
+        .stat-icon.info { background: rgba(59, 130, 246, 0.1); color: var(--info); }
 
-        .stat-value {{
+        .stat-value {
             font-size: 2rem;
             font-weight: 700;
             color: var(--gray-900);
             margin-bottom: 0.25rem;
-        }}
+        }
 
-        .stat-label {{
+        .stat-label {
             color: var(--gray-500);
             font-size: 0.875rem;
             font-weight: 500;
-        }}
+        }
 
         /* Score Card */
-        .score-card {{
+        .score-card {
             background: linear-gradient(135deg, var(--primary) 0%, var(--primary-dark) 100%);
             color: white;
-        }}
+        }
 
-        .score-card .stat-icon {{
+        .score-card .stat-icon {
             background: rgba(255, 255, 255, 0.2);
             color: white;
-        }}
+        }
 
-        .score-card .stat-value {{
+        .score-card .stat-value {
             color: white;
-        }}
+        }
 
-        .score-card .stat-label {{
+        .score-card .stat-label {
             color: rgba(255, 255, 255, 0.8);
-        }}
+        }
 
         /* Section */
-        .section {{
+        .section {
             background: rgba(255, 255, 255, 0.95);
             backdrop-filter: blur(10px);
             border-radius: 1rem;
             padding: 1.5rem;
             margin-bottom: 1.5rem;
             box-shadow: 0 10px 40px -10px rgba(0, 0, 0, 0.2);
-        }}
+        }
 
-        .section-header {{
+        .section-header {
             display: flex;
             justify-content: space-between;
             align-items: center;
             margin-bottom: 1rem;
             padding-bottom: 1rem;
             border-bottom: 1px solid var(--gray-200);
-        }}
+        }
 
-        .section-title {{
+        .section-title {
             font-size: 1.25rem;
             font-weight: 600;
             color: var(--gray-900);
             display: flex;
             align-items: center;
             gap: 0.5rem;
-        }}
+        }
 
-        .badge {{
+        .badge {
             display: inline-flex;
             align-items: center;
             padding: 0.25rem 0.75rem;
             border-radius: 9999px;
             font-size: 0.75rem;
             font-weight: 600;
-        }}
+        }
 
-        .badge-danger {{ background: rgba(239, 68, 68, 0.1); color: var(--danger); }}
-        .badge-warning {{ background: rgba(245, 158, 11, 0.1); color: var(--warning); }}
-        .badge-success {{ background: rgba(16, 185, 129, 0.1); color: var(--success); }}
-        .badge-info {{ background: rgba(59, 130, 246, 0.1); color: var(--info); }}
+        .badge-danger { background: rgba(239, 68, 68, 0.1); color: var(--danger); }
+        .badge-warning { background: rgba(245, 158, 11, 0.1); color: var(--warning); }
+        .badge-success { background: rgba(16, 185, 129, 0.1); color: var(--success); }
+        .badge-info { background: rgba(59, 130, 246, 0.1); color: var(--info); }
 
         /* Issue List */
-        .issue-list {{
+        .issue-list {
             list-style: none;
-        }}
+        }
 
-        .issue-item {{
+        .issue-item {
             padding: 1rem;
             border-radius: 0.5rem;
             margin-bottom: 0.75rem;
             border-left: 4px solid;
             background: var(--gray-50);
-        }}
+        }
 
-        .issue-item.critical {{
+        .issue-item.critical {
             border-color: var(--danger);
             background: rgba(239, 68, 68, 0.05);
-        }}
+        }
 
-        .issue-item.warning {{
+        .issue-item.warning {
             border-color: var(--warning);
             background: rgba(245, 158, 11, 0.05);
-        }}
+        }
 
-        .issue-item.info {{
+        .issue-item.info {
             border-color: var(--info);
             background: rgba(59, 130, 246, 0.05);
-        }}
+        }
 
-        .issue-header {{
+        .issue-header {
             display: flex;
             justify-content: space-between;
             align-items: flex-start;
             margin-bottom: 0.5rem;
-        }}
+        }
 
-        .issue-title {{
+        .issue-title {
             font-weight: 600;
             color: var(--gray-800);
-        }}
+        }
 
-        .issue-category {{
+        .issue-category {
             font-size: 0.75rem;
             padding: 0.125rem 0.5rem;
             border-radius: 4px;
             background: var(--gray-200);
             color: var(--gray-600);
-        }}
+        }
 
-        .issue-description {{
+        .issue-description {
             color: var(--gray-600);
             font-size: 0.875rem;
             margin-bottom: 0.5rem;
-        }}
+        }
 
-        .issue-suggestion {{
+        .issue-suggestion {
             color: var(--success);
             font-size: 0.875rem;
             display: flex;
             align-items: flex-start;
             gap: 0.5rem;
-        }}
+        }
 
-        .issue-context {{
+        .issue-context {
             font-family: 'Monaco', 'Consolas', monospace;
             font-size: 0.8rem;
             background: var(--gray-100);
@@ -336,157 +320,165 @@ def generate_html_report(report: AnalysisReport, output_path: Path) -> Path:
             border-radius: 4px;
             color: var(--gray-700);
             margin-top: 0.5rem;
-        }}
+        }
 
         /* AI Analysis */
-        .ai-page {{
+        .ai-page {
             border: 1px solid var(--gray-200);
             border-radius: 0.75rem;
             margin-bottom: 1rem;
             overflow: hidden;
-        }}
+        }
 
-        .ai-page-header {{
+        .ai-page-header {
             background: var(--gray-50);
             padding: 1rem;
             display: flex;
             justify-content: space-between;
             align-items: center;
             cursor: pointer;
-        }}
+        }
 
-        .ai-page-url {{
+        .ai-page-url {
             font-family: 'Monaco', 'Consolas', monospace;
             font-size: 0.875rem;
             color: var(--primary-dark);
-        }}
+        }
 
-        .ai-score {{
+        .ai-score {
             display: flex;
             align-items: center;
             gap: 0.5rem;
-        }}
+        }
 
-        .score-bar {{
+        .score-bar {
             width: 100px;
             height: 8px;
             background: var(--gray-200);
             border-radius: 4px;
             overflow: hidden;
-        }}
+        }
 
-        .score-fill {{
+        .score-fill {
             height: 100%;
             border-radius: 4px;
             transition: width 0.5s ease;
-        }}
+        }
 
-        .score-fill.excellent {{ background: var(--success); }}
-        .score-fill.good {{ background: var(--info); }}
-        .score-fill.fair {{ background: var(--warning); }}
-        .score-fill.poor {{ background: var(--danger); }}
+        .score-fill.excellent { background: var(--success); }
+        .score-fill.good { background: var(--info); }
+        .score-fill.fair { background: var(--warning); }
+        .score-fill.poor { background: var(--danger); }
 
-        .ai-page-content {{
+        .ai-page-content {
             padding: 1rem;
             display: none;
-        }}
+        }
 
-        .ai-page.expanded .ai-page-content {{
+        .ai-page.expanded .ai-page-content {
             display: block;
-        }}
+        }
 
-        .ai-summary {{
+        .ai-summary {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
             gap: 1rem;
             margin-bottom: 1rem;
-        }}
+        }
 
-        .ai-summary-card {{
+        .ai-summary-card {
             background: var(--gray-50);
             padding: 1rem;
             border-radius: 0.5rem;
-        }}
+        }
 
-        .ai-summary-title {{
+        .ai-summary-title {
             font-weight: 600;
             font-size: 0.875rem;
             color: var(--gray-700);
             margin-bottom: 0.5rem;
-        }}
+        }
 
-        .ai-summary-text {{
+        .ai-summary-text {
             color: var(--gray-600);
             font-size: 0.875rem;
-        }}
+        }
 
         /* Empty State */
-        .empty-state {{
+        .empty-state {
             text-align: center;
             padding: 3rem;
             color: var(--gray-500);
-        }}
+        }
 
-        .empty-icon {{
+        .empty-icon {
             font-size: 3rem;
             margin-bottom: 1rem;
-        }}
+        }
 
         /* Footer */
-        .footer {{
+        .footer {
             text-align: center;
             padding: 2rem;
             color: rgba(255, 255, 255, 0.8);
             font-size: 0.875rem;
-        }}
+        }
 
-        .footer a {{
+        .footer a {
             color: white;
             text-decoration: none;
-        }}
+        }
 
         /* Responsive */
-        @media (max-width: 768px) {{
-            .container {{
+        @media (max-width: 768px) {
+            .container {
                 padding: 1rem;
-            }}
+            }
 
-            .header-top {{
+            .header-top {
                 flex-direction: column;
-            }}
+            }
 
-            .scan-meta {{
+            .scan-meta {
                 text-align: left;
-            }}
+            }
 
-            .stats-grid {{
+            .stats-grid {
                 grid-template-columns: repeat(2, 1fr);
-            }}
-        }}
+            }
+        }
 
         /* Collapsible */
-        .collapsible-toggle {{
+        .collapsible-toggle {
             cursor: pointer;
             user-select: none;
-        }}
+        }
 
-        .collapsible-toggle::after {{
+        .collapsible-toggle::after {
             content: '\\25BC';
             font-size: 0.75rem;
             margin-left: 0.5rem;
             transition: transform 0.2s;
-        }}
+        }
 
-        .collapsed .collapsible-toggle::after {{
+        .collapsed .collapsible-toggle::after {
             transform: rotate(-90deg);
-        }}
+        }
 
-        .collapsed .collapsible-content {{
+        .collapsed .collapsible-content {
             display: none;
-        }}
-    </style>
-</head>
-<body>
+        }
+"""
+
+_CSS_BLOCK = (
+    '<link href="https://fonts.googleapis.com/css2?'
+    'family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">\n'
+    f"<style>{_minify_css(_STYLESHEET)}</style>\n"
+    "</head>\n"
+)
+
+# Filled in with str.format(); contains no literal braces
+_BODY_OPEN_TEMPLATE = _minify_markup("""<body>
     <div class="container">
         <!-- Header -->
         <header class="header">
@@ -496,23 +488,23 @@ def generate_html_report(report: AnalysisReport, output_path: Path) -> Path:
                     <span class="logo-text">Web Scanner Report</span>
                 </div>
                 <div class="scan-meta">
-                    <div>Scanned: {report.scan_started.strftime('%B %d, %Y at %H:%M')}</div>
+                    <div>Scanned: {scanned}</div>
                     <div>Duration: {duration}</div>
                 </div>
             </div>
-            <div class="url-display">{html.escape(report.base_url)}</div>
+            <div class="url-display">{base_url}</div>
         </header>
 
         <!-- Stats -->
         <div class="stats-grid">
             <div class="stat-card">
                 <div class="stat-icon primary">&#128196;</div>
-                <div class="stat-value">{report.pages_crawled}</div>
+                <div class="stat-value">{pages_crawled}</div>
                 <div class="stat-label">Pages Crawled</div>
             </div>
             <div class="stat-card">
                 <div class="stat-icon success">&#9989;</div>
-                <div class="stat-value">{report.pages_analyzed}</div>
+                <div class="stat-value">{pages_analyzed}</div>
                 <div class="stat-label">Pages Analyzed</div>
             </div>
             <div class="stat-card">
@@ -520,18 +512,29 @@ def generate_html_report(report: AnalysisReport, output_path: Path) -> Path:
                 <div class="stat-value">{total_issues}</div>
                 <div class="stat-label">Issues Found</div>
             </div>
-            {_generate_fourth_stat_card(ai_stats, report)}
+            {fourth_stat_card}
         </div>
 
-        {_generate_ai_section(report, ai_stats)}
-
-        {_generate_grammar_section(report)}
+        """)
 
-        {_generate_links_section(report)}
+_SECTION_SEPARATOR = "\n\n"
 
-        {_generate_ocr_section(report)}
+# Shared wrapper for every report section; filled in with str.format(). This runs
+# a handful of times per report. The per-issue cards stay inline f-strings, which
+# compile to a single BUILD_STRING and beat format()/format_map() by an order of
+# magnitude in the loops
+_SECTION_TEMPLATE = _minify_markup("""
+    <section class="{css_class}">
+        <div class="section-header collapsible-toggle">
+            <h2 class="section-title">{title}</h2>
+            {badges}
+        </div>
+        <div class="collapsible-content">
+            {content}
+        </div>
+    </section>""")
 
-        {_generate_errors_section(report)}
+_FOOTER = _minify_markup("""
 
         <!-- Footer -->
         <footer class="footer">
@@ -539,32 +542,154 @@ def generate_html_report(report: AnalysisReport, output_path: Path) -> Path:
         </footer>
     </div>
 
-    <script>
+""")
+
+_JS_BLOCK = _minify_markup("""    <script>
         // Toggle collapsible sections
-        document.querySelectorAll('.ai-page-header').forEach(header => {{
-            header.addEventListener('click', () => {{
+        document.querySelectorAll('.ai-page-header').forEach(header => {
+            header.addEventListener('click', () => {
                 header.parentElement.classList.toggle('expanded');
-            }});
-        }});
+            });
+        });
 
-        document.querySelectorAll('.section-header.collapsible-toggle').forEach(header => {{
-            header.addEventListener('click', () => {{
+        document.querySelectorAll('.section-header.collapsible-toggle').forEach(header => {
+            header.addEventListener('click', () => {
                 header.parentElement.classList.toggle('collapsed');
-            }});
-        }});
+            });
+        });
 
         // Expand first AI page by default
         const firstAiPage = document.querySelector('.ai-page');
         if (firstAiPage) firstAiPage.classList.add('expanded');
     </script>
 </body>
-</html>"""
+</html>""")
+
+# AI issues are listed most severe first; unknown severities sort last
+_SEVERITY_ORDER = {"critical": 0, "warning": 1, "info": 2}
+
+# Characters html.escape() would replace. Escaping itself stays with html.escape():
+# a str.translate() table is a single pass, but it falls off CPython's ASCII fast
+# path and is several times slower on prose with more than one or two quotes
+_ESCAPE_NEEDED = re.compile(r"[<>&\"']")
+
+
+def _escape(text: str) -> str:
+    """html.escape() that returns plain text untouched without any replace passes."""
+    return html.escape(text) if _ESCAPE_NEEDED.search(text) else text
+
+
+# Output buffer for the report file
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Shown on an AI page with nothing to report
+_EMPTY_STATE_HTML = (
+    '<div class="empty-state"><div class="empty-icon">&#9989;</div><p>No issues found</p></div>'
+)
+
+# Visual score thresholds and the score-bar class for each band between them
+_SCORE_THRESHOLDS = (4, 6, 8)
+_SCORE_CLASSES = ("poor", "fair", "good", "excellent")
+
+# Categories, issue types and page URLs repeat across many issues, so their
+# escaped forms are cached instead of rescanned for every card
+_esc = lru_cache(maxsize=4096)(_escape)
+
+
+def generate_html_report(report: "AnalysisReport", output_path: Path) -> Path:
+    """Generate a beautiful static HTML report."""
+    # A typical report fits the buffer whole, so it reaches the disk in a single
+    # write() call; larger ones flush in 1 MiB chunks. newline="" skips the
+    # line-ending translation pass
+    with output_path.open("w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_SIZE) as f:
+        write_html_report(report, f)
 
-    output_path.write_text(html_content, encoding="utf-8")
     return output_path
 
 
-def _generate_fourth_stat_card(ai_stats: dict, report: AnalysisReport) -> str:
+def write_html_report(report: "AnalysisReport", stream: TextIO) -> None:
+    """
+    Write the HTML report to an open text stream.
+
+    Sections go out one by one, so the whole document is never held in
+    memory at once. Any file-like object works, e.g. io.StringIO in tests.
+    """
+
+    # Calculate stats
+    total_issues = (
+        len(report.grammar_issues) +
+        len(report.link_issues) +
+        len(report.ocr_issues)
+    )
+
+    ai_stats = {}
+    if report.ai_analyses:
+        # Count issues per kind and per severity in a single pass
+        text_issues = html_issues = visual_issues = 0
+        severities = Counter()
+        for a in report.ai_analyses:
+            text_issues += len(a.text_issues)
+            html_issues += len(a.html_issues)
+            visual_issues += len(a.visual_issues)
+            severities.update(
+                i.severity for i in chain(a.text_issues, a.html_issues, a.visual_issues)
+            )
+
+        ai_stats = {
+            "pages": len(report.ai_analyses),
+            "text_issues": text_issues,
+            "html_issues": html_issues,
+            "visual_issues": visual_issues,
+            "total": text_issues + html_issues + visual_issues,
+            "critical": severities["critical"],
+            "warning": severities["warning"],
+            "info": severities["info"],
+        }
+
+        # Average visual score
+        scores = [a.visual_score for a in report.ai_analyses if a.visual_score is not None]
+        ai_stats["avg_score"] = sum(scores) / len(scores) if scores else None
+
+    # Calculate duration
+    duration = ""
+    if report.scan_completed:
+        delta = report.scan_completed - report.scan_started
+        minutes, seconds = divmod(int(delta.total_seconds()), 60)
+        duration = f"{minutes}m {seconds}s" if minutes else f"{seconds}s"
+
+    write = stream.write
+    write(_HEAD_OPEN)
+    write(f"<title>Web Scanner Report - {html.escape(report.base_url)}</title>\n")
+    write(_CSS_BLOCK)
+    write(
+        _BODY_OPEN_TEMPLATE.format(
+            scanned=report.scan_started.strftime("%B %d, %Y at %H:%M"),
+            duration=duration,
+            base_url=html.escape(report.base_url),
+            pages_crawled=report.pages_crawled,
+            pages_analyzed=report.pages_analyzed,
+            total_issues=total_issues,
+            fourth_stat_card=_generate_fourth_stat_card(ai_stats, report),
+        )
+    )
+
+    # Sections render one after another: building them is pure-Python string work
+    # that holds the GIL throughout, so a thread pool would only add overhead
+    write(_generate_ai_section(report, ai_stats))
+    for generate_section in (
+        _generate_grammar_section,
+        _generate_links_section,
+        _generate_ocr_section,
+        _generate_errors_section,
+    ):
+        write(_SECTION_SEPARATOR)
+        write(generate_section(report))
+
+    write(_FOOTER)
+    write(_JS_BLOCK)
+
+
+def _generate_fourth_stat_card(ai_stats: dict, report: "AnalysisReport") -> str:
     """Generate the fourth stat card (score or errors)."""
     if ai_stats.get("avg_score"):
         avg_score = ai_stats["avg_score"]
@@ -581,79 +706,101 @@ def _generate_fourth_stat_card(ai_stats: dict, report: AnalysisReport) -> str:
             </div>'''
 
 
-def _generate_ai_section(report: AnalysisReport, ai_stats: dict) -> str:
+def _coerce_summary(summary) -> str:
+    """Render an AI summary as text; visual summaries can arrive as a dict."""
+    kind = type(summary)
+    if kind is str:
+        return summary
+    if kind is dict:
+        return summary["overall_quality"] if "overall_quality" in summary else str(summary)
+    return str(summary)
+
+
+def _generate_ai_section(report: "AnalysisReport", ai_stats: dict) -> str:
     """Generate AI analysis section."""
     if not report.ai_analyses:
         return ""
 
-    pages_html = ""
+    # Hot loop for large reports: bind lookups to locals once
+    severity_rank = _SEVERITY_ORDER.get
+    escape, esc = _escape, _esc
+    page_parts = []
+    add_page = page_parts.append
     for analysis in report.ai_analyses:
-        score = analysis.visual_score or 0
-        score_class = "excellent" if score >= 8 else "good" if score >= 6 else "fair" if score >= 4 else "poor"
-
-        issues_html = ""
-        all_issues = analysis.text_issues + analysis.html_issues + analysis.visual_issues
-        for issue in sorted(all_issues, key=lambda x: {"critical": 0, "warning": 1, "info": 2}.get(x.severity, 3)):
-            issues_html += f'''
+        issue_parts = []
+        add_issue = issue_parts.append
+        all_issues = chain(analysis.text_issues, analysis.html_issues, analysis.visual_issues)
+        for issue in sorted(all_issues, key=lambda x: severity_rank(x.severity, 3)):
+            add_issue(f'''
             <div class="issue-item {issue.severity}">
                 <div class="issue-header">
-                    <span class="issue-title">{html.escape(issue.description[:100])}</span>
-                    <span class="issue-category">{html.escape(issue.category)}</span>
+                    <span class="issue-title">{escape(issue.description[:100])}</span>
+                    <span class="issue-category">{esc(issue.category)}</span>
                 </div>
-                {f'<div class="issue-description">{html.escape(issue.location)}</div>' if issue.location else ''}
-                {f'<div class="issue-suggestion">&#128161; {html.escape(issue.suggestion)}</div>' if issue.suggestion else ''}
-            </div>'''
+                {f'<div class="issue-description">{escape(issue.location)}</div>' if issue.location else ''}
+                {f'<div class="issue-suggestion">&#128161; {escape(issue.suggestion)}</div>' if issue.suggestion else ''}
+            </div>''')
+        issues_html = "".join(issue_parts)
 
         summaries_html = ""
-        if analysis.text_summary or analysis.html_summary or analysis.visual_summary:
-            summaries_html = '<div class="ai-summary">'
-            if analysis.text_summary:
-                text_summary_str = analysis.text_summary if isinstance(analysis.text_summary, str) else str(analysis.text_summary)
-                summaries_html += f'''
+        text_summary = analysis.text_summary
+        html_summary = analysis.html_summary
+        visual_summary = analysis.visual_summary
+        if text_summary or html_summary or visual_summary:
+            summary_parts = ['<div class="ai-summary">']
+            if text_summary:
+                summary_parts.append(f'''
                 <div class="ai-summary-card">
                     <div class="ai-summary-title">&#128221; Text Analysis</div>
-                    <div class="ai-summary-text">{html.escape(text_summary_str)}</div>
-                </div>'''
-            if analysis.html_summary:
-                html_summary_str = analysis.html_summary if isinstance(analysis.html_summary, str) else str(analysis.html_summary)
-                summaries_html += f'''
+                    <div class="ai-summary-text">{escape(_coerce_summary(text_summary))}</div>
+                </div>''')
+            if html_summary:
+                summary_parts.append(f'''
                 <div class="ai-summary-card">
                     <div class="ai-summary-title">&#128187; HTML Analysis</div>
-                    <div class="ai-summary-text">{html.escape(html_summary_str)}</div>
-                </div>'''
-            if analysis.visual_summary:
-                # visual_summary can be a dict from enhanced AI response
-                if isinstance(analysis.visual_summary, dict):
-                    visual_summary_str = analysis.visual_summary.get("overall_quality", str(analysis.visual_summary))
-                else:
-                    visual_summary_str = str(analysis.visual_summary) if analysis.visual_summary else ""
-                summaries_html += f'''
+                    <div class="ai-summary-text">{escape(_coerce_summary(html_summary))}</div>
+                </div>''')
+            if visual_summary:
+                summary_parts.append(f'''
                 <div class="ai-summary-card">
                     <div class="ai-summary-title">&#127912; Visual Analysis</div>
-                    <div class="ai-summary-text">{html.escape(visual_summary_str)}</div>
-                </div>'''
-            summaries_html += '</div>'
+                    <div class="ai-summary-text">{escape(_coerce_summary(visual_summary))}</div>
+                </div>''')
+            summary_parts.append('</div>')
+            summaries_html = "".join(summary_parts)
 
         # Add text corrections section if available
         text_corrections_html = ""
-        if hasattr(analysis, 'text_corrections') and analysis.text_corrections:
-            text_corrections_html = '<div style="margin-top: 1rem;"><h4 style="color: var(--gray-700); margin-bottom: 0.5rem;">&#9998; Text Corrections</h4>'
+        if analysis.text_corrections:
+            correction_parts = [
+                '<div style="margin-top: 1rem;">'
+                '<h4 style="color: var(--gray-700); margin-bottom: 0.5rem;">'
+                "&#9998; Text Corrections</h4>"
+            ]
             for tc in analysis.text_corrections[:10]:
-                confidence_str = f" (confidence: {tc.confidence}/5)" if hasattr(tc, 'confidence') and tc.confidence else ""
-                text_corrections_html += f'''
+                confidence_str = f" (confidence: {tc.confidence}/5)" if tc.confidence else ""
+                correction_parts.append(
+                    f'''
                 <div class="issue-item info" style="border-color: var(--success);">
                     <div class="issue-header">
-                        <span class="issue-title" style="text-decoration: line-through; color: var(--danger);">{html.escape(tc.original)}</span>
+                        <span class="issue-title" '''
+                    f'''style="text-decoration: line-through; color: var(--danger);">'''
+                    f'''{escape(tc.original)}</span>
                         <span class="issue-category">Text Correction{confidence_str}</span>
                     </div>
-                    <div class="issue-suggestion" style="font-weight: 600;">&#10004; {html.escape(tc.correction)}</div>
-                    <div class="issue-description">{html.escape(tc.explanation)}</div>
+                    <div class="issue-suggestion" style="font-weight: 600;">'''
+                    f'''&#10004; {escape(tc.correction)}</div>
+                    <div class="issue-description">{escape(tc.explanation)}</div>
                 </div>'''
-            text_corrections_html += '</div>'
+                )
+            correction_parts.append('</div>')
+            text_corrections_html = "".join(correction_parts)
 
         # Build score HTML separately to avoid nested f-string issues
         score_html = ""
-        if analysis.visual_score:
+        score = analysis.visual_score
+        if score:
+            score_class = _SCORE_CLASSES[bisect_right(_SCORE_THRESHOLDS, score)]
             score_width = score * 10
             score_html = f'''<div class="ai-score">
                     <span>{score:.1f}/10</span>
@@ -662,12 +809,14 @@ def _generate_ai_section(report: AnalysisReport, ai_stats: dict) -> str:
                     </div>
                 </div>'''
 
-        issues_list_html = f'<ul class="issue-list">{issues_html}</ul>' if issues_html else '<div class="empty-state"><div class="empty-icon">&#9989;</div><p>No issues found</p></div>'
+        issues_list_html = (
+            f'<ul class="issue-list">{issues_html}</ul>' if issues_html else _EMPTY_STATE_HTML
+        )
 
-        pages_html += f'''
+        add_page(f'''
         <div class="ai-page">
             <div class="ai-page-header">
-                <span class="ai-page-url">{html.escape(analysis.url)}</span>
+                <span class="ai-page-url">{esc(analysis.url)}</span>
                 {score_html}
             </div>
             <div class="ai-page-content">
@@ -675,135 +824,139 @@ def _generate_ai_section(report: AnalysisReport, ai_stats: dict) -> str:
                 {issues_list_html}
                 {text_corrections_html}
             </div>
-        </div>'''
+        </div>''')
+    pages_html = "".join(page_parts)
 
-    return f'''
-    <section class="section">
-        <div class="section-header collapsible-toggle">
-            <h2 class="section-title">&#129302; AI-Powered Analysis</h2>
-            <div>
+    return _SECTION_TEMPLATE.format(
+        css_class="section",
+        title="&#129302; AI-Powered Analysis",
+        badges=f'''<div>
                 <span class="badge badge-danger">{ai_stats.get("critical", 0)} critical</span>
                 <span class="badge badge-warning">{ai_stats.get("warning", 0)} warnings</span>
                 <span class="badge badge-info">{ai_stats.get("info", 0)} info</span>
-            </div>
-        </div>
-        <div class="collapsible-content">
-            {pages_html}
-        </div>
-    </section>'''
+            </div>''',
+        content=pages_html,
+    )
 
 
-def _generate_grammar_section(report: AnalysisReport) -> str:
+def _generate_grammar_section(report: "AnalysisReport") -> str:
     """Generate grammar issues section."""
-    if not report.grammar_issues:
+    issues = report.grammar_issues
+    if not issues:
         return ""
+    total = len(issues)
 
-    issues_html = ""
-    for issue in report.grammar_issues[:50]:  # Limit to 50
-        issues_html += f'''
+    issue_parts = []
+    for issue in issues[:50]:  # Limit to 50
+        issue_parts.append(f'''
         <div class="issue-item warning">
             <div class="issue-header">
-                <span class="issue-title">{html.escape(issue.message)}</span>
-                <span class="issue-category">{html.escape(issue.category or 'Grammar')}</span>
+                <span class="issue-title">{_escape(issue.message)}</span>
+                <span class="issue-category">{_esc(issue.category or 'Grammar')}</span>
             </div>
-            <div class="issue-context">...{html.escape(issue.context)}...</div>
-            {f'<div class="issue-suggestion">&#128161; Suggestions: {html.escape(", ".join(issue.suggestions[:3]))}</div>' if issue.suggestions else ''}
-        </div>'''
-
-    more = f'<p style="text-align: center; color: var(--gray-500);">...and {len(report.grammar_issues) - 50} more issues</p>' if len(report.grammar_issues) > 50 else ''
+            <div class="issue-context">...{_escape(issue.context)}...</div>
+            {
+                f'<div class="issue-suggestion">&#128161; Suggestions: '
+                f'{_escape(", ".join(issue.suggestions[:3]))}</div>'
+                if issue.suggestions
+                else ''
+            }
+        </div>''')
+    issues_html = "".join(issue_parts)
+
+    more = (
+        f'<p style="text-align: center; color: var(--gray-500);">'
+        f"...and {total - 50} more issues</p>"
+        if total > 50
+        else ""
+    )
 
-    return f'''
-    <section class="section">
-        <div class="section-header collapsible-toggle">
-            <h2 class="section-title">&#128221; Grammar Issues</h2>
-            <span class="badge badge-warning">{len(report.grammar_issues)} issues</span>
-        </div>
-        <div class="collapsible-content">
-            <ul class="issue-list">{issues_html}</ul>
-            {more}
-        </div>
-    </section>'''
+    return _SECTION_TEMPLATE.format(
+        css_class="section",
+        title="&#128221; Grammar Issues",
+        badges=f'<span class="badge badge-warning">{total} issues</span>',
+        content=f'<ul class="issue-list">{issues_html}</ul>\n            {more}',
+    )
 
 
-def _generate_links_section(report: AnalysisReport) -> str:
+def _generate_links_section(report: "AnalysisReport") -> str:
     """Generate broken links section."""
-    if not report.link_issues:
+    issues = report.link_issues
+    if not issues:
         return ""
+    total = len(issues)
 
-    issues_html = ""
-    for issue in report.link_issues[:50]:
-        issues_html += f'''
+    issue_parts = []
+    for issue in issues[:50]:
+        issue_parts.append(f'''
         <div class="issue-item critical">
             <div class="issue-header">
-                <span class="issue-title">{html.escape(issue.target_url[:80])}</span>
-                <span class="issue-category">{html.escape(issue.error_type or 'Broken')}</span>
+                <span class="issue-title">{_escape(issue.target_url[:80])}</span>
+                <span class="issue-category">{_esc(issue.error_type or 'Broken')}</span>
             </div>
-            <div class="issue-description">Source: {html.escape(issue.source_url)}</div>
-            <div class="issue-description" style="color: var(--danger);">&#10060; {html.escape(issue.error_message or 'Link is broken')}</div>
-        </div>'''
-
-    more = f'<p style="text-align: center; color: var(--gray-500);">...and {len(report.link_issues) - 50} more broken links</p>' if len(report.link_issues) > 50 else ''
+            <div class="issue-description">Source: {_esc(issue.source_url)}</div>
+            <div class="issue-description" style="color: var(--danger);">'''
+            f'''&#10060; {_escape(issue.error_message or 'Link is broken')}</div>
+        </div>''')
+    issues_html = "".join(issue_parts)
+
+    more = (
+        f'<p style="text-align: center; color: var(--gray-500);">'
+        f"...and {total - 50} more broken links</p>"
+        if total > 50
+        else ""
+    )
 
-    return f'''
-    <section class="section">
-        <div class="section-header collapsible-toggle">
-            <h2 class="section-title">&#128279; Broken Links</h2>
-            <span class="badge badge-danger">{len(report.link_issues)} broken</span>
-        </div>
-        <div class="collapsible-content">
-            <ul class="issue-list">{issues_html}</ul>
-            {more}
-        </div>
-    </section>'''
+    return _SECTION_TEMPLATE.format(
+        css_class="section",
+        title="&#128279; Broken Links",
+        badges=f'<span class="badge badge-danger">{total} broken</span>',
+        content=f'<ul class="issue-list">{issues_html}</ul>\n            {more}',
+    )
 
 
-def _generate_ocr_section(report: AnalysisReport) -> str:
+def _generate_ocr_section(report: "AnalysisReport") -> str:
     """Generate OCR issues section."""
-    if not report.ocr_issues:
+    issues = report.ocr_issues
+    if not issues:
         return ""
 
-    issues_html = ""
-    for issue in report.ocr_issues[:30]:
-        issues_html += f'''
+    issue_parts = []
+    for issue in issues[:30]:
+        issue_parts.append(f'''
         <div class="issue-item info">
             <div class="issue-header">
-                <span class="issue-title">{html.escape(issue.issue_type)}</span>
+                <span class="issue-title">{_esc(issue.issue_type)}</span>
                 <span class="issue-category">OCR ({issue.confidence:.0%} confidence)</span>
             </div>
-            <div class="issue-description">{html.escape(issue.description)}</div>
-        </div>'''
-
-    return f'''
-    <section class="section collapsed">
-        <div class="section-header collapsible-toggle">
-            <h2 class="section-title">&#128065; OCR Issues</h2>
-            <span class="badge badge-info">{len(report.ocr_issues)} issues</span>
-        </div>
-        <div class="collapsible-content">
-            <ul class="issue-list">{issues_html}</ul>
-        </div>
-    </section>'''
+            <div class="issue-description">{_escape(issue.description)}</div>
+        </div>''')
+    issues_html = "".join(issue_parts)
+
+    return _SECTION_TEMPLATE.format(
+        css_class="section collapsed",
+        title="&#128065; OCR Issues",
+        badges=f'<span class="badge badge-info">{len(issues)} issues</span>',
+        content=f'<ul class="issue-list">{issues_html}</ul>',
+    )
 
 
-def _generate_errors_section(report: AnalysisReport) -> str:
+def _generate_errors_section(report: "AnalysisReport") -> str:
     """Generate errors section."""
     if not report.errors:
         return ""
 
-    errors_html = ""
+    error_parts = []
     for error in report.errors:
-        errors_html += f'''
+        error_parts.append(f'''
         <div class="issue-item critical">
-            <div class="issue-description">{html.escape(error)}</div>
-        </div>'''
-
-    return f'''
-    <section class="section collapsed">
-        <div class="section-header collapsible-toggle">
-            <h2 class="section-title">&#9888; Errors</h2>
-            <span class="badge badge-danger">{len(report.errors)} errors</span>
-        </div>
-        <div class="collapsible-content">
-            <ul class="issue-list">{errors_html}</ul>
-        </div>
-    </section>'''
+            <div class="issue-description">{_escape(error)}</div>
+        </div>''')
+    errors_html = "".join(error_parts)
+
+    return _SECTION_TEMPLATE.format(
+        css_class="section collapsed",
+        title="&#9888; Errors",
+        badges=f'<span class="badge badge-danger">{len(report.errors)} errors</span>',
+        content=f'<ul class="issue-list">{errors_html}</ul>',
+    )
@@ -1,11 +1,17 @@
 """Storage manager for organizing extracted data."""
 
-import json
+import asyncio
+import gzip
+import io
+import os
+from collections import Counter, defaultdict
+from collections.abc import Iterator
 from datetime import datetime
-from pathlib import Path
+from itertools import chain
+from pathlib import Path, PurePath
 from urllib.parse import urlparse
 
-import aiofiles
+import orjson
 import structlog
 
 from ..config import settings
@@ -15,6 +21,17 @@ from .html_report import generate_html_report
 logger = structlog.get_logger()
 
 
+def _json_default(obj):
+    """Encode types orjson doesn't handle natively; paths become strings."""
+    if isinstance(obj, PurePath):
+        return os.fspath(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+# Characters in a domain that cannot appear in a scan folder name
+_DOMAIN_UNSAFE_CHARS = str.maketrans(":/.", "___")
+
+
 class StorageManager:
     """Manages storage of extracted data and reports."""
 
@@ -28,26 +45,28 @@ class StorageManager:
 
         self.output_dir = (output_dir or settings.output_dir) / folder_name
         self.reports_dir = settings.reports_dir / folder_name
+        self.issues_path = self.reports_dir / "issues.jsonl"
+        self._issues_lock = asyncio.Lock()
 
         self._setup_directories()
 
     def _sanitize_domain(self, domain: str) -> str:
         """Convert domain to safe folder name."""
-        return domain.replace(":", "_").replace("/", "_").replace(".", "_")
+        return domain.translate(_DOMAIN_UNSAFE_CHARS)
 
     def _setup_directories(self) -> None:
         """Create necessary directory structure."""
-        directories = [
-            self.output_dir,
+        # Only the leaves are listed; makedirs() creates output_dir on the way
+        directories = (
             self.output_dir / "html",
             self.output_dir / "text",
             self.output_dir / "screenshots",
             self.output_dir / "metadata",
             self.reports_dir,
-        ]
+        )
 
         for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
+            os.makedirs(directory, exist_ok=True)
 
         logger.info("Storage directories created", output_dir=str(self.output_dir))
 
@@ -64,7 +83,7 @@ class StorageManager:
         metadata = {
             "base_url": self.base_url,
             "domain": self.domain,
-            "crawled_at": datetime.now().isoformat(),
+            "crawled_at": datetime.now(),
             "total_pages": len(pages),
             "pages": [
                 {
@@ -75,7 +94,7 @@ class StorageManager:
                     "depth": page.depth,
                     "links_count": len(page.links),
                     "response_time_ms": page.response_time_ms,
-                    "crawled_at": page.crawled_at.isoformat(),
+                    "crawled_at": page.crawled_at,
                     "error_message": page.error_message,
                 }
                 for page in pages
@@ -83,9 +102,7 @@ class StorageManager:
         }
 
         filepath = self.output_dir / "metadata" / "crawl_metadata.json"
-
-        async with aiofiles.open(filepath, "w", encoding="utf-8") as f:
-            await f.write(json.dumps(metadata, indent=2))
+        await self._write_atomic(filepath, orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
 
         logger.info("Saved crawl metadata", path=str(filepath))
         return filepath
@@ -94,14 +111,15 @@ class StorageManager:
         """Save index of extracted data."""
         index = {
             "base_url": self.base_url,
-            "extracted_at": datetime.now().isoformat(),
+            "extracted_at": datetime.now(),
             "total_pages": len(data),
             "pages": [
                 {
                     "url": item.url,
-                    "html_path": str(item.html_path) if item.html_path else None,
-                    "text_path": str(item.text_path) if item.text_path else None,
-                    "screenshot_path": str(item.screenshot_path) if item.screenshot_path else None,
+                    "html_path": item.html_path,
+                    "text_path": item.text_path,
+                    "screenshot_path": item.screenshot_path,
+                    "duplicate_of": item.duplicate_of,
                     "metadata": item.metadata,
                 }
                 for item in data
@@ -109,32 +127,98 @@ class StorageManager:
         }
 
         filepath = self.output_dir / "metadata" / "extraction_index.json"
-
-        async with aiofiles.open(filepath, "w", encoding="utf-8") as f:
-            await f.write(json.dumps(index, indent=2))
+        await self._write_atomic(
+            filepath, orjson.dumps(index, default=_json_default, option=orjson.OPT_INDENT_2)
+        )
 
         logger.info("Saved extraction index", path=str(filepath))
         return filepath
 
-    async def save_analysis_report(self, report: AnalysisReport) -> Path:
-        """Save the complete analysis report."""
+    async def append_issues(self, kind: str, issues: list) -> None:
+        """Append issues to ``issues.jsonl`` as soon as an analyzer reports them.
+
+        Each line is ``{"type": kind, "issue": {...}}``. Issues found before a
+        crash stay on disk even if the final report is never written.
+        """
+        if not issues:
+            return
+
+        lines = b"".join(orjson.dumps({"type": kind, "issue": issue}) + b"\n" for issue in issues)
+
+        # Appends from concurrent analyzers must not interleave
+        async with self._issues_lock:
+            await asyncio.to_thread(self._append_bytes, self.issues_path, lines)
+
+    @staticmethod
+    def _append_bytes(filepath: Path, content: bytes) -> None:
+        """Append bytes to a file (blocking)."""
+        with open(filepath, "ab") as f:
+            f.write(content)
+
+    async def _write_atomic(self, filepath: Path, content: bytes) -> None:
+        """Write a file via a temporary sibling and rename it into place.
+
+        Readers never observe a partially written file, and a crash mid-write
+        leaves the previous version intact.
+        """
+        tmp_path = filepath.with_name(filepath.name + ".tmp")
+
+        await asyncio.to_thread(tmp_path.write_bytes, content)
+        os.replace(tmp_path, filepath)
+
+    @staticmethod
+    def _write_json_stream(filepath: Path, fields: dict, compress: bool = False) -> None:
+        """Atomically write a compact JSON object one field at a time (blocking).
+
+        Iterator values become arrays written element by element. With
+        ``compress`` the output is gzipped as it is written.
+        """
+        tmp_path = filepath.with_name(filepath.name + ".tmp")
+
+        opener = gzip.open(tmp_path, "wb", compresslevel=6) if compress else open(tmp_path, "wb")
+        with opener as f:
+            separator = b"{"
+            for key, value in fields.items():
+                f.write(separator + orjson.dumps(key) + b":")
+                separator = b","
+
+                if not isinstance(value, Iterator):
+                    f.write(orjson.dumps(value))
+                    continue
+
+                item_separator = b"["
+                for item in value:
+                    f.write(item_separator + orjson.dumps(item))
+                    item_separator = b","
+                f.write(b"[]" if item_separator == b"[" else b"]")
+            f.write(b"}")
+
+        os.replace(tmp_path, filepath)
+
+    async def save_analysis_report(
+        self, report: AnalysisReport, checkpoint: bool = False
+    ) -> Path:
+        """Save the complete analysis report.
+
+        Args:
+            report: The report to save.
+            checkpoint: Only snapshot the JSON report, skipping the summary
+                and HTML renderings. Used between scan phases so a crash
+                does not lose the work done so far.
+        """
         # Calculate AI analysis summary stats
         ai_summary = {}
         if report.ai_analyses:
-            total_text_issues = sum(len(a.text_issues) for a in report.ai_analyses)
-            total_html_issues = sum(len(a.html_issues) for a in report.ai_analyses)
-            total_visual_issues = sum(len(a.visual_issues) for a in report.ai_analyses)
-
-            # Count by severity
-            all_ai_issues = []
+            # Count issues per kind and per severity in a single pass
+            total_text_issues = total_html_issues = total_visual_issues = 0
+            severities = Counter()
             for a in report.ai_analyses:
-                all_ai_issues.extend(a.text_issues)
-                all_ai_issues.extend(a.html_issues)
-                all_ai_issues.extend(a.visual_issues)
-
-            critical_count = sum(1 for i in all_ai_issues if i.severity == "critical")
-            warning_count = sum(1 for i in all_ai_issues if i.severity == "warning")
-            info_count = sum(1 for i in all_ai_issues if i.severity == "info")
+                total_text_issues += len(a.text_issues)
+                total_html_issues += len(a.html_issues)
+                total_visual_issues += len(a.visual_issues)
+                severities.update(
+                    i.severity for i in chain(a.text_issues, a.html_issues, a.visual_issues)
+                )
 
             # Calculate average visual score
             visual_scores = [a.visual_score for a in report.ai_analyses if a.visual_score is not None]
@@ -147,17 +231,17 @@ class StorageManager:
                 "total_visual_issues": total_visual_issues,
                 "total_ai_issues": total_text_issues + total_html_issues + total_visual_issues,
                 "issues_by_severity": {
-                    "critical": critical_count,
-                    "warning": warning_count,
-                    "info": info_count,
+                    "critical": severities["critical"],
+                    "warning": severities["warning"],
+                    "info": severities["info"],
                 },
                 "average_visual_score": round(avg_visual_score, 2) if avg_visual_score else None,
             }
 
         report_data = {
             "base_url": report.base_url,
-            "scan_started": report.scan_started.isoformat(),
-            "scan_completed": report.scan_completed.isoformat() if report.scan_completed else None,
+            "scan_started": report.scan_started,
+            "scan_completed": report.scan_completed,
             "summary": {
                 "pages_crawled": report.pages_crawled,
                 "pages_analyzed": report.pages_analyzed,
@@ -167,39 +251,16 @@ class StorageManager:
                 "total_errors": len(report.errors),
                 "ai_analysis": ai_summary if ai_summary else None,
             },
-            "grammar_issues": [
-                {
-                    "message": issue.message,
-                    "context": issue.context,
-                    "suggestions": issue.suggestions,
-                    "offset": issue.offset,
-                    "length": issue.length,
-                    "rule_id": issue.rule_id,
-                    "category": issue.category,
-                }
-                for issue in report.grammar_issues
-            ],
-            "link_issues": [
-                {
-                    "source_url": issue.source_url,
-                    "target_url": issue.target_url,
-                    "status_code": issue.status_code,
-                    "error_type": issue.error_type,
-                    "error_message": issue.error_message,
-                }
-                for issue in report.link_issues
-            ],
-            "ocr_issues": [
-                {
-                    "screenshot_path": issue.screenshot_path,
-                    "extracted_text": issue.extracted_text,
-                    "issue_type": issue.issue_type,
-                    "description": issue.description,
-                    "confidence": issue.confidence,
-                }
-                for issue in report.ocr_issues
-            ],
-            "ai_analysis": [
+            # These dataclasses serialize field for field, so orjson encodes
+            # them directly without an intermediate dict per issue
+            "grammar_issues": iter(report.grammar_issues),
+            "link_issues": iter(report.link_issues),
+            "ocr_issues": iter(report.ocr_issues),
+        }
+
+        # Scans without AI analysis leave the key out entirely
+        if report.ai_analyses:
+            report_data["ai_analysis"] = (
                 {
                     "url": analysis.url,
                     "visual_score": analysis.visual_score,
@@ -236,40 +297,41 @@ class StorageManager:
                             "description": issue.description,
                             "location": issue.location,
                             "suggestion": issue.suggestion,
-                            "bbox": issue.bbox if hasattr(issue, 'bbox') else None,
-                            "evidence": issue.evidence if hasattr(issue, 'evidence') else None,
-                            "confidence": issue.confidence if hasattr(issue, 'confidence') else None,
+                            "bbox": issue.bbox,
+                            "evidence": issue.evidence,
+                            "confidence": issue.confidence,
                         }
                         for issue in analysis.visual_issues
                     ],
-                    "text_corrections": [
-                        {
-                            "original": tc.original,
-                            "correction": tc.correction,
-                            "explanation": tc.explanation,
-                            "bbox": tc.bbox if hasattr(tc, 'bbox') else None,
-                            "confidence": tc.confidence if hasattr(tc, 'confidence') else None,
-                        }
-                        for tc in (analysis.text_corrections if hasattr(analysis, 'text_corrections') else [])
-                    ],
+                    "text_corrections": analysis.text_corrections,
                 }
                 for analysis in report.ai_analyses
-            ] if report.ai_analyses else [],
-            "errors": report.errors,
-        }
-
-        filepath = self.reports_dir / "analysis_report.json"
-
-        async with aiofiles.open(filepath, "w", encoding="utf-8") as f:
-            await f.write(json.dumps(report_data, indent=2))
-
-        # Also save a human-readable summary
+            )
+        report_data["errors"] = report.errors
+
+        # The issue lists are generators: each issue is encoded and written on
+        # its own, so the report never exists in memory as one document. The
+        # file is compact; issues.jsonl has the same issues one per line
+        filename = "analysis_report.json.gz" if settings.compress_report else "analysis_report.json"
+        filepath = self.reports_dir / filename
+        write_json = asyncio.to_thread(
+            self._write_json_stream, filepath, report_data, settings.compress_report
+        )
+
+        if checkpoint:
+            await write_json
+            logger.debug("Saved report checkpoint", path=str(filepath))
+            return filepath
+
+        # The JSON, the human-readable summary and the HTML report only read
+        # the report, so they are written concurrently
         summary_path = self.reports_dir / "summary.txt"
-        await self._save_human_readable_summary(report, summary_path)
-
-        # Generate beautiful HTML report
         html_path = self.reports_dir / "report.html"
-        generate_html_report(report, html_path)
+        await asyncio.gather(
+            write_json,
+            self._save_human_readable_summary(report, summary_path),
+            asyncio.to_thread(generate_html_report, report, html_path),
+        )
         logger.info("Saved HTML report", path=str(html_path))
 
         logger.info("Saved analysis report", path=str(filepath))
@@ -277,24 +339,31 @@ class StorageManager:
 
     async def _save_human_readable_summary(self, report: AnalysisReport, filepath: Path) -> None:
         """Save a human-readable summary of the analysis."""
-        lines = [
-            "=" * 80,
-            "WEB SCANNER ANALYSIS REPORT",
-            "=" * 80,
-            "",
-            f"Website: {report.base_url}",
-            f"Scan Started: {report.scan_started}",
-            f"Scan Completed: {report.scan_completed}",
-            "",
-            "SUMMARY",
-            "-" * 40,
-            f"Pages Crawled: {report.pages_crawled}",
-            f"Pages Analyzed: {report.pages_analyzed}",
-            f"Grammar Issues: {len(report.grammar_issues)}",
-            f"Broken Links: {len(report.link_issues)}",
-            f"OCR Issues: {len(report.ocr_issues)}",
-            f"Errors: {len(report.errors)}",
-        ]
+        # Each write() carries its own newlines, instead of collecting
+        # thousands of short lines for one final join
+        buf = io.StringIO()
+        write = buf.write
+        rule = "=" * 80
+        thin_rule = "-" * 40
+
+        write(
+            f"{rule}\n"
+            "WEB SCANNER ANALYSIS REPORT\n"
+            f"{rule}\n"
+            "\n"
+            f"Website: {report.base_url}\n"
+            f"Scan Started: {report.scan_started}\n"
+            f"Scan Completed: {report.scan_completed}\n"
+            "\n"
+            "SUMMARY\n"
+            f"{thin_rule}\n"
+            f"Pages Crawled: {report.pages_crawled}\n"
+            f"Pages Analyzed: {report.pages_analyzed}\n"
+            f"Grammar Issues: {len(report.grammar_issues)}\n"
+            f"Broken Links: {len(report.link_issues)}\n"
+            f"OCR Issues: {len(report.ocr_issues)}\n"
+            f"Errors: {len(report.errors)}\n"
+        )
 
         # Add AI Analysis summary if available
         if report.ai_analyses:
@@ -304,164 +373,127 @@ class StorageManager:
             visual_scores = [a.visual_score for a in report.ai_analyses if a.visual_score]
             avg_score = sum(visual_scores) / len(visual_scores) if visual_scores else None
 
-            lines.extend([
-                "",
-                "AI ANALYSIS SUMMARY",
-                "-" * 40,
-                f"Pages Analyzed by AI: {len(report.ai_analyses)}",
-                f"AI Text Issues: {total_text}",
-                f"AI HTML Issues: {total_html}",
-                f"AI Visual Issues: {total_visual}",
-            ])
+            write(
+                "\n"
+                "AI ANALYSIS SUMMARY\n"
+                f"{thin_rule}\n"
+                f"Pages Analyzed by AI: {len(report.ai_analyses)}\n"
+                f"AI Text Issues: {total_text}\n"
+                f"AI HTML Issues: {total_html}\n"
+                f"AI Visual Issues: {total_visual}\n"
+            )
             if avg_score:
-                lines.append(f"Average Visual Score: {avg_score:.1f}/10")
+                write(f"Average Visual Score: {avg_score:.1f}/10\n")
 
-        lines.append("")
+        write("\n")
 
         if report.grammar_issues:
-            lines.extend([
-                "GRAMMAR ISSUES",
-                "-" * 40,
-            ])
+            write(f"GRAMMAR ISSUES\n{thin_rule}\n")
             for i, issue in enumerate(report.grammar_issues[:20], 1):  # Limit to first 20
-                lines.extend([
-                    f"{i}. {issue.message}",
-                    f"   Context: ...{issue.context}...",
-                    f"   Suggestions: {', '.join(issue.suggestions[:3])}",
-                    "",
-                ])
+                write(
+                    f"{i}. {issue.message}\n"
+                    f"   Context: ...{issue.context}...\n"
+                    f"   Suggestions: {', '.join(issue.suggestions[:3])}\n"
+                    "\n"
+                )
             if len(report.grammar_issues) > 20:
-                lines.append(f"   ... and {len(report.grammar_issues) - 20} more issues")
-            lines.append("")
+                write(f"   ... and {len(report.grammar_issues) - 20} more issues\n")
+            write("\n")
 
         if report.link_issues:
-            lines.extend([
-                "BROKEN LINKS",
-                "-" * 40,
-            ])
+            write(f"BROKEN LINKS\n{thin_rule}\n")
             for i, issue in enumerate(report.link_issues[:20], 1):
-                lines.extend([
-                    f"{i}. {issue.target_url}",
-                    f"   Source: {issue.source_url}",
-                    f"   Error: {issue.error_type} - {issue.error_message}",
-                    "",
-                ])
+                write(
+                    f"{i}. {issue.target_url}\n"
+                    f"   Source: {issue.source_url}\n"
+                    f"   Error: {issue.error_type} - {issue.error_message}\n"
+                    "\n"
+                )
             if len(report.link_issues) > 20:
-                lines.append(f"   ... and {len(report.link_issues) - 20} more issues")
-            lines.append("")
+                write(f"   ... and {len(report.link_issues) - 20} more issues\n")
+            write("\n")
 
         if report.ocr_issues:
-            lines.extend([
-                "OCR ISSUES (from screenshots)",
-                "-" * 40,
-            ])
+            write(f"OCR ISSUES (from screenshots)\n{thin_rule}\n")
             for i, issue in enumerate(report.ocr_issues[:20], 1):
-                lines.extend([
-                    f"{i}. {issue.issue_type}",
-                    f"   Description: {issue.description}",
-                    f"   Confidence: {issue.confidence:.2f}",
-                    "",
-                ])
+                write(
+                    f"{i}. {issue.issue_type}\n"
+                    f"   Description: {issue.description}\n"
+                    f"   Confidence: {issue.confidence:.2f}\n"
+                    "\n"
+                )
             if len(report.ocr_issues) > 20:
-                lines.append(f"   ... and {len(report.ocr_issues) - 20} more issues")
-            lines.append("")
+                write(f"   ... and {len(report.ocr_issues) - 20} more issues\n")
+            write("\n")
 
         # AI Analysis detailed results
         if report.ai_analyses:
-            lines.extend([
-                "=" * 80,
-                "AI-POWERED ANALYSIS DETAILS",
-                "=" * 80,
-                "",
-                "The AI analyzed text content, HTML structure, and visual appearance",
-                "of each page to identify issues that traditional tools might miss.",
-                "",
-            ])
+            write(
+                f"{rule}\n"
+                "AI-POWERED ANALYSIS DETAILS\n"
+                f"{rule}\n"
+                "\n"
+                "The AI analyzed text content, HTML structure, and visual appearance\n"
+                "of each page to identify issues that traditional tools might miss.\n"
+                "\n"
+            )
 
             for analysis in report.ai_analyses:
-                lines.extend([
-                    "-" * 80,
-                    f"PAGE: {analysis.url}",
-                    "-" * 80,
-                ])
+                write(f"{'-' * 80}\nPAGE: {analysis.url}\n{'-' * 80}\n")
 
                 if analysis.visual_score is not None:
                     score_text = "Excellent" if analysis.visual_score >= 8 else "Good" if analysis.visual_score >= 6 else "Needs Improvement" if analysis.visual_score >= 4 else "Poor"
-                    lines.append(f"Visual Score: {analysis.visual_score:.1f}/10 ({score_text})")
-                    lines.append("")
+                    write(f"Visual Score: {analysis.visual_score:.1f}/10 ({score_text})\n\n")
 
                 # Text Analysis Summary
                 if analysis.text_summary:
-                    lines.extend([
-                        "TEXT ANALYSIS:",
-                        f"  {analysis.text_summary}",
-                        "",
-                    ])
+                    write(f"TEXT ANALYSIS:\n  {analysis.text_summary}\n\n")
 
                 # HTML Analysis Summary
                 if analysis.html_summary:
-                    lines.extend([
-                        "HTML ANALYSIS:",
-                        f"  {analysis.html_summary}",
-                        "",
-                    ])
+                    write(f"HTML ANALYSIS:\n  {analysis.html_summary}\n\n")
 
                 # Visual Analysis Summary
                 if analysis.visual_summary:
-                    lines.extend([
-                        "VISUAL ANALYSIS:",
-                        f"  {analysis.visual_summary}",
-                        "",
-                    ])
-
-                # Critical Issues
-                all_issues = analysis.text_issues + analysis.html_issues + analysis.visual_issues
-                critical = [i for i in all_issues if i.severity == "critical"]
-                warnings = [i for i in all_issues if i.severity == "warning"]
+                    write(f"VISUAL ANALYSIS:\n  {analysis.visual_summary}\n\n")
+
+                # Group the page's issues by severity in one pass
+                by_severity = defaultdict(list)
+                page_issues = chain(
+                    analysis.text_issues, analysis.html_issues, analysis.visual_issues
+                )
+                for issue in page_issues:
+                    by_severity[issue.severity].append(issue)
+                critical = by_severity["critical"]
+                warnings = by_severity["warning"]
 
                 if critical:
-                    lines.extend([
-                        f"CRITICAL ISSUES ({len(critical)}):",
-                    ])
+                    write(f"CRITICAL ISSUES ({len(critical)}):\n")
                     for issue in critical[:10]:
-                        lines.extend([
-                            f"  [{issue.category}] {issue.description}",
-                        ])
+                        write(f"  [{issue.category}] {issue.description}\n")
                         if issue.location:
-                            lines.append(f"    Location: {issue.location}")
+                            write(f"    Location: {issue.location}\n")
                         if issue.suggestion:
-                            lines.append(f"    Fix: {issue.suggestion}")
-                        lines.append("")
+                            write(f"    Fix: {issue.suggestion}\n")
+                        write("\n")
 
                 if warnings:
-                    lines.extend([
-                        f"WARNINGS ({len(warnings)}):",
-                    ])
+                    write(f"WARNINGS ({len(warnings)}):\n")
                     for issue in warnings[:10]:
-                        lines.extend([
-                            f"  [{issue.category}] {issue.description}",
-                        ])
+                        write(f"  [{issue.category}] {issue.description}\n")
                         if issue.suggestion:
-                            lines.append(f"    Fix: {issue.suggestion}")
-                        lines.append("")
+                            write(f"    Fix: {issue.suggestion}\n")
+                        write("\n")
 
-                lines.append("")
+                write("\n")
 
         # Errors section
         if report.errors:
-            lines.extend([
-                "ERRORS DURING SCAN",
-                "-" * 40,
-            ])
+            write(f"ERRORS DURING SCAN\n{thin_rule}\n")
             for error in report.errors:
-                lines.append(f"  - {error}")
-            lines.append("")
+                write(f"  - {error}\n")
+            write("\n")
 
-        lines.extend([
-            "=" * 80,
-            "END OF REPORT",
-            "=" * 80,
-        ])
+        write(f"{rule}\nEND OF REPORT\n{rule}")
 
-        async with aiofiles.open(filepath, "w", encoding="utf-8") as f:
-            await f.write("\n".join(lines))
+        await asyncio.to_thread(filepath.write_text, buf.getvalue(), encoding="utf-8")
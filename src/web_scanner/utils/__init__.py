@@ -1,5 +1,6 @@
 """Utility functions for the web scanner."""
 
+from .concurrency import AdaptiveLimiter, Autoscaler
 from .logging import setup_logging
 
-__all__ = ["setup_logging"]
+__all__ = ["AdaptiveLimiter", "Autoscaler", "setup_logging"]
@@ -0,0 +1,93 @@
+"""Load-adaptive concurrency limits."""
+
+import asyncio
+
+import psutil
+import structlog
+
+logger = structlog.get_logger()
+
+# Grow while the machine has headroom on both CPU and memory
+CPU_LOW_PERCENT = 70.0
+MEMORY_LOW_PERCENT = 75.0
+
+# Halve when memory runs short, before the OS starts swapping or killing
+MEMORY_HIGH_PERCENT = 85.0
+
+
+class AdaptiveLimiter:
+    """
+    Async context manager that bounds concurrent holders, like a semaphore
+    whose limit can be changed while tasks are waiting on it.
+
+    Lowering the limit never interrupts current holders; new ones simply
+    wait until enough of them have left.
+    """
+
+    def __init__(self, limit: int, min_limit: int = 1, max_limit: int | None = None):
+        self.min_limit = min_limit
+        self.max_limit = max_limit or limit
+        self._limit = max(min_limit, min(limit, self.max_limit))
+        self._active = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current maximum number of concurrent holders."""
+        return self._limit
+
+    async def set_limit(self, limit: int) -> None:
+        """Change the limit, clamped to ``[min_limit, max_limit]``."""
+        async with self._condition:
+            self._limit = max(self.min_limit, min(limit, self.max_limit))
+            self._condition.notify_all()
+
+    async def __aenter__(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._active < self._limit)
+            self._active += 1
+
+    async def __aexit__(self, *exc_info) -> None:
+        async with self._condition:
+            self._active -= 1
+            self._condition.notify()
+
+
+def next_limit(limit: int, cpu_percent: float, memory_percent: float) -> int:
+    """Pick the next limit for the given system load."""
+    if memory_percent > MEMORY_HIGH_PERCENT:
+        return limit // 2
+    if cpu_percent < CPU_LOW_PERCENT and memory_percent < MEMORY_LOW_PERCENT:
+        return limit + 1
+    return limit
+
+
+class Autoscaler:
+    """Periodically resizes limiters from live CPU and memory usage."""
+
+    def __init__(self, *limiters: AdaptiveLimiter, interval: float = 2.0):
+        self.limiters = limiters
+        self.interval = interval
+
+    async def run(self) -> None:
+        """Sample system load and adjust the limiters until cancelled."""
+        # The first cpu_percent() call only primes the counter
+        psutil.cpu_percent(interval=None)
+
+        while True:
+            await asyncio.sleep(self.interval)
+
+            cpu_percent = psutil.cpu_percent(interval=None)
+            memory_percent = psutil.virtual_memory().percent
+
+            for limiter in self.limiters:
+                previous = limiter.limit
+                await limiter.set_limit(next_limit(previous, cpu_percent, memory_percent))
+
+                if limiter.limit != previous:
+                    logger.debug(
+                        "Concurrency limit adjusted",
+                        limit=limiter.limit,
+                        cpu_percent=cpu_percent,
+                        memory_percent=memory_percent,
+                    )
@@ -0,0 +1,64 @@
+"""Tests for concurrency utilities."""
+
+import asyncio
+
+from web_scanner.utils.concurrency import AdaptiveLimiter, next_limit
+
+
+class TestAdaptiveLimiter:
+    """Test cases for AdaptiveLimiter."""
+
+    async def test_limits_concurrent_holders(self):
+        """Test that no more than ``limit`` tasks hold the limiter at once."""
+        limiter = AdaptiveLimiter(2)
+        active = 0
+        peak = 0
+
+        async def work():
+            nonlocal active, peak
+            async with limiter:
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(work() for _ in range(6)))
+        assert peak == 2
+
+    async def test_raising_limit_releases_waiters(self):
+        """Test that waiting tasks proceed when the limit is raised."""
+        limiter = AdaptiveLimiter(1, max_limit=2)
+        await limiter.__aenter__()
+
+        waiter = asyncio.create_task(limiter.__aenter__())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await limiter.set_limit(2)
+        await asyncio.wait_for(waiter, timeout=1)
+
+    async def test_limit_is_clamped(self):
+        """Test that the limit stays within its bounds."""
+        limiter = AdaptiveLimiter(4, min_limit=2, max_limit=8)
+
+        await limiter.set_limit(100)
+        assert limiter.limit == 8
+
+        await limiter.set_limit(0)
+        assert limiter.limit == 2
+
+
+class TestNextLimit:
+    """Test cases for the autoscaling rule."""
+
+    def test_grows_with_headroom(self):
+        """Test that the limit grows while CPU and memory are idle."""
+        assert next_limit(4, cpu_percent=20, memory_percent=40) == 5
+
+    def test_halves_under_memory_pressure(self):
+        """Test that the limit halves when memory runs short."""
+        assert next_limit(8, cpu_percent=20, memory_percent=90) == 4
+
+    def test_holds_when_busy(self):
+        """Test that the limit is unchanged under moderate load."""
+        assert next_limit(4, cpu_percent=85, memory_percent=60) == 4
@@ -1,7 +1,11 @@
 """Tests for the web crawler module."""
 
+import asyncio
+from contextlib import asynccontextmanager
+
 import pytest
-from web_scanner.crawler import WebCrawler
+from web_scanner.crawler import WebCrawler, crawler as crawler_module
+from web_scanner.models import CrawledPage, PageStatus
 
 
 class TestWebCrawler:
@@ -88,3 +92,140 @@ class TestWebCrawler:
 
         html_no_title = "<html><head></head><body></body></html>"
         assert crawler._extract_title(html_no_title) is None
+
+        html_blank_title = "<html><head><title> \n </title></head><body></body></html>"
+        assert crawler._extract_title(html_blank_title) is None
+
+
+class FakeBrowserManager:
+    """Browser manager stand-in that tracks whether pages are still open."""
+
+    instances: list["FakeBrowserManager"] = []
+
+    def __init__(self):
+        self.open_pages = 0
+        self.open_pages_at_stop: int | None = None
+        FakeBrowserManager.instances.append(self)
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        self.open_pages_at_stop = self.open_pages
+
+    @asynccontextmanager
+    async def new_page(self):
+        self.open_pages += 1
+        try:
+            yield object()
+        finally:
+            self.open_pages -= 1
+
+
+def make_crawler(site: dict[str, list[str]], **kwargs) -> WebCrawler:
+    """Create a crawler whose pages and links come from ``site``."""
+    crawler = WebCrawler("https://example.com", capture_screenshots=False, **kwargs)
+    crawler.fetched = []
+
+    async def fetch_page(url, depth, page):
+        crawler.fetched.append(url)
+        await asyncio.sleep(0)
+        return CrawledPage(url=url, status=PageStatus.SUCCESS, links=site[url], depth=depth)
+
+    crawler._fetch_page = fetch_page
+    return crawler
+
+
+@pytest.fixture
+def fake_browser(monkeypatch):
+    FakeBrowserManager.instances.clear()
+    monkeypatch.setattr(crawler_module, "BrowserManager", FakeBrowserManager)
+    return FakeBrowserManager.instances
+
+
+SITE = {
+    "https://example.com": ["https://example.com/a", "https://example.com/b"],
+    "https://example.com/a": ["https://example.com/c"],
+    "https://example.com/b": ["https://example.com/c"],
+    "https://example.com/c": [],
+}
+
+
+class TestIterCrawl:
+    """Test cases for streaming crawl results."""
+
+    async def test_yields_pages_in_crawl_order(self, fake_browser):
+        """Test that pages are yielded in the order they were fetched."""
+        crawler = make_crawler(SITE, concurrent_requests=1)
+
+        urls = [page.url for page in [p async for p in crawler.iter_crawl()]]
+
+        assert urls == crawler.fetched
+        assert urls == [
+            "https://example.com",
+            "https://example.com/a",
+            "https://example.com/b",
+            "https://example.com/c",
+        ]
+        assert [page.url for page in crawler.crawled_pages] == urls
+
+    async def test_streams_before_crawl_finishes(self, fake_browser):
+        """Test that the first page arrives while later pages are still pending."""
+        crawler = make_crawler(SITE, concurrent_requests=1)
+        fetch_page = crawler._fetch_page
+        release = asyncio.Event()
+
+        async def gated_fetch(url, depth, page):
+            if depth > 0:
+                await release.wait()
+            return await fetch_page(url, depth, page)
+
+        crawler._fetch_page = gated_fetch
+        crawl = crawler.iter_crawl()
+
+        first = await anext(crawl)
+        assert first.url == "https://example.com"
+        assert crawler.fetched == ["https://example.com"]
+
+        release.set()
+        remaining = [page async for page in crawl]
+        assert len(remaining) == 3
+
+    async def test_early_exit_closes_pages_before_browser(self, fake_browser):
+        """Test that stopping early waits for workers before stopping the browser."""
+        crawler = make_crawler(SITE, concurrent_requests=2)
+        fetch_page = crawler._fetch_page
+
+        async def slow_fetch(url, depth, page):
+            if depth > 0:
+                await asyncio.sleep(10)
+            return await fetch_page(url, depth, page)
+
+        crawler._fetch_page = slow_fetch
+        crawl = crawler.iter_crawl()
+
+        await anext(crawl)
+        # Let both workers start fetching the linked pages
+        await asyncio.sleep(0.01)
+        assert fake_browser[0].open_pages == 2
+
+        await crawl.aclose()
+
+        assert fake_browser[0].open_pages_at_stop == 0
+
+    async def test_url_linked_from_several_pages_is_queued_once(self, fake_browser):
+        """Test that a URL linked from several pages is queued and fetched only once."""
+        crawler = make_crawler(SITE, concurrent_requests=1)
+        queued: list[str] = []
+        put = crawler.url_queue.put
+
+        async def counting_put(item):
+            queued.append(item[0])
+            await put(item)
+
+        crawler.url_queue.put = counting_put
+
+        await crawler.crawl()
+
+        assert queued.count("https://example.com/c") == 1
+        assert crawler.fetched.count("https://example.com/c") == 1
@@ -0,0 +1,51 @@
+"""Tests for the HTML report generator."""
+
+import io
+from datetime import datetime
+
+from web_scanner.models import AnalysisReport, GrammarIssue
+from web_scanner.storage.html_report import generate_html_report, write_html_report
+
+
+def make_report() -> AnalysisReport:
+    report = AnalysisReport(
+        base_url="https://example.com/?a=1&b=2",
+        scan_started=datetime(2024, 1, 1, 12, 0),
+    )
+    report.grammar_issues.append(
+        GrammarIssue(
+            message="Use <em> sparingly",
+            context="it's a <em>test</em>",
+            suggestions=["test"],
+            offset=0,
+            length=4,
+            rule_id="TEST_RULE",
+            category="STYLE",
+        )
+    )
+    return report
+
+
+class TestHtmlReport:
+    """Test cases for HTML report generation."""
+
+    def test_stream_matches_file(self, tmp_path):
+        """Test that writing to a stream produces the same document as the file."""
+        report = make_report()
+        stream = io.StringIO()
+
+        write_html_report(report, stream)
+        output_path = generate_html_report(report, tmp_path / "report.html")
+
+        assert stream.getvalue() == output_path.read_text(encoding="utf-8")
+
+    def test_escapes_issue_text(self):
+        """Test that issue text and URLs are HTML-escaped."""
+        stream = io.StringIO()
+        write_html_report(make_report(), stream)
+        content = stream.getvalue()
+
+        assert "https://example.com/?a=1&amp;b=2" in content
+        assert "Use &lt;em&gt; sparingly" in content
+        assert "it&#x27;s a &lt;em&gt;test&lt;/em&gt;" in content
+        assert "<em>" not in content
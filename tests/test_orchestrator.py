@@ -0,0 +1,233 @@
+"""Tests for the scan orchestrator."""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from web_scanner.config import settings
+from web_scanner.models import AnalysisReport, CrawledPage, GrammarIssue, OCRIssue, PageStatus
+from web_scanner.orchestrator import ScanOrchestrator
+
+
+def make_grammar_issue(message: str) -> GrammarIssue:
+    return GrammarIssue(
+        message=message,
+        context=message,
+        suggestions=[],
+        offset=0,
+        length=1,
+        rule_id="TEST_RULE",
+        category="TYPOS",
+    )
+
+
+def make_ocr_issue(text: str) -> OCRIssue:
+    return OCRIssue(
+        screenshot_path="page.png",
+        extracted_text=text,
+        issue_type="spelling",
+        description=text,
+        confidence=0.9,
+    )
+
+
+def make_page(path: str, text: str) -> CrawledPage:
+    return CrawledPage(
+        url=f"https://example.com{path}",
+        status=PageStatus.SUCCESS,
+        html=f"<html><body>{text}</body></html>",
+        text=text,
+        screenshot_path=f"/screenshots{path}.png",
+    )
+
+
+@pytest.fixture
+def orchestrator(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "reports_dir", tmp_path / "reports")
+    orchestrator = ScanOrchestrator("https://example.com", output_dir=tmp_path)
+    orchestrator.report = AnalysisReport(
+        base_url="https://example.com", scan_started=datetime.now()
+    )
+    return orchestrator
+
+
+async def returns(issues):
+    return issues
+
+
+async def fails(message):
+    raise RuntimeError(message)
+
+
+class TestAnalysisBatches:
+    """Test cases for collecting background analysis batches."""
+
+    async def test_grammar_keeps_issues_from_other_batches(self, orchestrator):
+        """Test that a failed grammar batch does not discard the others' issues."""
+        first, second = make_grammar_issue("first"), make_grammar_issue("second")
+        orchestrator._pending_grammar = [
+            asyncio.create_task(returns([first])),
+            asyncio.create_task(fails("LanguageTool crashed")),
+            asyncio.create_task(returns([second])),
+        ]
+
+        await orchestrator._run_grammar_analysis()
+
+        assert orchestrator.report.grammar_issues == [first, second]
+        assert orchestrator.report.errors == ["Grammar analysis error: LanguageTool crashed"]
+
+    async def test_ocr_keeps_issues_from_other_batches(self, orchestrator):
+        """Test that a failed OCR batch does not discard the others' issues."""
+        issue = make_ocr_issue("teh")
+        orchestrator._pending_ocr = [
+            asyncio.create_task(fails("Tesseract crashed")),
+            asyncio.create_task(returns([issue])),
+        ]
+
+        await orchestrator._run_ocr_analysis()
+
+        assert orchestrator.report.ocr_issues == [issue]
+        assert orchestrator.report.errors == ["OCR analysis error: Tesseract crashed"]
+
+    async def test_grammar_start_failure_reported_once(self, orchestrator, tmp_path):
+        """Test that LanguageTool failing to start is attempted and reported once."""
+        analyzer = orchestrator.grammar_analyzer
+        attempts = 0
+
+        def init_tool():
+            nonlocal attempts
+            attempts += 1
+            raise RuntimeError("LanguageTool unavailable")
+
+        analyzer._init_tool = init_tool
+        orchestrator._pending_grammar = [
+            asyncio.create_task(analyzer.analyze_batch([tmp_path / f"{i}.txt"]))
+            for i in range(3)
+        ]
+
+        await orchestrator._run_grammar_analysis()
+
+        assert attempts == 1
+        assert orchestrator.report.errors == ["Grammar analysis error: LanguageTool unavailable"]
+
+    async def test_timeout_keeps_finished_checks(self, orchestrator, monkeypatch):
+        """Test that a timeout cancels only the unfinished checks."""
+        monkeypatch.setattr(settings, "grammar_timeout", 0.05)
+        issue = make_grammar_issue("finished")
+        hanging = asyncio.create_task(asyncio.sleep(10))
+        orchestrator._pending_grammar = [asyncio.create_task(returns([issue])), hanging]
+
+        await orchestrator._run_grammar_analysis()
+
+        assert orchestrator.report.grammar_issues == [issue]
+        assert orchestrator.report.errors == [
+            "Grammar analysis timed out after 0.05s; 1 of 2 checks unfinished"
+        ]
+        assert hanging.cancelled()
+
+    async def test_link_timeout_keeps_checked_links(self, orchestrator, monkeypatch):
+        """Test that links checked before a link analysis timeout are still reported."""
+        monkeypatch.setattr(settings, "link_timeout", 0.05)
+        analyzer = orchestrator.link_analyzer
+
+        async def check_url(url):
+            if url.endswith("/slow"):
+                await asyncio.sleep(10)
+            analyzer._checked_urls[url] = (404, None)
+            return analyzer._checked_urls[url]
+
+        analyzer._check_url = check_url
+        page = CrawledPage(
+            url="https://example.com",
+            status=PageStatus.SUCCESS,
+            status_code=200,
+            links=["https://example.com/missing", "https://example.com/slow"],
+        )
+        orchestrator._successful_pages = [page]
+
+        await orchestrator._run_link_analysis()
+        await analyzer.stop()
+
+        assert [issue.target_url for issue in orchestrator.report.link_issues] == [
+            "https://example.com/missing"
+        ]
+        assert analyzer.unchecked_urls == ["https://example.com/slow"]
+        assert orchestrator.report.errors == [
+            "Link analysis timed out after 0.05s; 1 links unchecked"
+        ]
+
+
+class TestDuplicatePages:
+    """Test cases for skipping analysis of pages with repeated text."""
+
+    async def test_whitespace_differences_are_duplicates(self, orchestrator):
+        """Test that pages differing only in whitespace are treated as duplicates."""
+        first = make_page("/a", "Hello world.\n\nSecond line.")
+        second = make_page("/b", "  Hello   world.\tSecond line.  ")
+
+        first_data = await orchestrator._extract_page(first)
+        second_data = await orchestrator._extract_page(second)
+
+        assert first_data.duplicate_of is None
+        assert second_data.duplicate_of == "https://example.com/a"
+
+    async def test_first_page_in_crawl_order_is_canonical(self, orchestrator):
+        """Test that the earliest page stays canonical while extractions overlap."""
+        pages = [make_page(path, "Same text") for path in ("/a", "/b", "/c")]
+
+        extracted = await asyncio.gather(*(orchestrator._extract_page(page) for page in pages))
+
+        assert [data.duplicate_of for data in extracted] == [
+            None,
+            "https://example.com/a",
+            "https://example.com/a",
+        ]
+
+    async def test_disabled(self, orchestrator, monkeypatch):
+        """Test that dedupe_pages=False analyzes every page."""
+        monkeypatch.setattr(settings, "dedupe_pages", False)
+
+        await orchestrator._extract_page(make_page("/a", "Same text"))
+        second_data = await orchestrator._extract_page(make_page("/b", "Same text"))
+
+        assert second_data.duplicate_of is None
+        assert len(orchestrator._grammar_batch) == 2
+        assert len(orchestrator._ocr_batch) == 2
+
+    async def test_duplicates_skip_grammar_but_not_ocr(self, orchestrator):
+        """Test that duplicate pages skip the grammar batch but are still OCR'd."""
+        extracted = [
+            await orchestrator._extract_page(make_page(path, text))
+            for path, text in (("/a", "Same text"), ("/b", "Same text"), ("/c", "Other text"))
+        ]
+
+        assert orchestrator._grammar_batch == [extracted[0].text_path, extracted[2].text_path]
+        assert orchestrator._ocr_batch == [data.screenshot_path for data in extracted]
+
+
+class TestCleanup:
+    """Test cases for releasing resources at the end of a scan."""
+
+    async def test_pending_checks_finish_before_analyzers_stop(self, orchestrator):
+        """Test that cancelled checks have unwound before the analyzers are stopped."""
+        unwound = asyncio.Event()
+        done_at_stop = []
+
+        async def hanging_check():
+            try:
+                await asyncio.sleep(10)
+            finally:
+                await asyncio.sleep(0)
+                unwound.set()
+
+        async def stop():
+            done_at_stop.append(unwound.is_set())
+
+        orchestrator._pending_grammar = [asyncio.create_task(hanging_check())]
+        await asyncio.sleep(0)
+        orchestrator.grammar_analyzer.stop = stop
+
+        await orchestrator._cleanup()
+
+        assert done_at_stop == [True]
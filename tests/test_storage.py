@@ -0,0 +1,41 @@
+"""Tests for the storage manager."""
+
+import gzip
+
+import orjson
+
+from web_scanner.storage.manager import StorageManager
+
+
+class TestWriteJsonStream:
+    """Test cases for streamed JSON report writing."""
+
+    def test_matches_regular_dump(self, tmp_path):
+        """Test that streamed output matches encoding the whole object at once."""
+        issues = [{"message": "line\nbreak", "suggestions": ["a", "b"]}, {"nested": {"x": []}}]
+        expected = orjson.dumps(
+            {"base_url": "https://example.com", "issues": issues, "empty": [], "errors": ["e"]}
+        )
+
+        filepath = tmp_path / "report.json"
+        StorageManager._write_json_stream(
+            filepath,
+            {
+                "base_url": "https://example.com",
+                "issues": iter(issues),
+                "empty": iter([]),
+                "errors": ["e"],
+            },
+        )
+
+        assert filepath.read_bytes() == expected
+        assert not filepath.with_name("report.json.tmp").exists()
+
+    def test_compressed(self, tmp_path):
+        """Test that compressed output decompresses to the same JSON."""
+        filepath = tmp_path / "report.json.gz"
+        StorageManager._write_json_stream(
+            filepath, {"issues": iter([{"a": 1}, {"b": 2}])}, compress=True
+        )
+
+        assert gzip.decompress(filepath.read_bytes()) == b'{"issues":[{"a":1},{"b":2}]}'